@@ -267,7 +267,7 @@ def draw_connection_settings_ui(layout: bpy.types.UILayout):
     split.label(text="Session Log:")
     sub_row = split.row()
     icon = icons.icons_col["General_Explorer_32"]
-    user_data_path = os.environ.get("MIXER_DATA_DIR", get_data_directory())
+    user_data_path = os.environ.get("MIXER_DATA_DIR") or get_data_directory()
     #   from pathlib import Path
     #   user_data_path = Path(user_data_path).parent
     sub_row.operator("mixer.open_explorer", text="Open Log Folder", icon_value=icon.icon_id).path = str(user_data_path)
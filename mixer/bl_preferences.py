@@ -33,6 +33,7 @@ from mixer.share_data import share_data
 from mixer.local_data import get_data_directory
 
 logger = logging.getLogger(__name__)
+_package_logger = logging.getLogger(__package__)
 
 
 def gen_random_color():
@@ -43,10 +44,31 @@ def gen_random_color():
 
 
 def set_log_level(self, value):
-    logging.getLogger(__package__).setLevel(value)
+    _package_logger.setLevel(value)
     logger.log(value, "Logging level changed")
 
 
+def environment_defaults():
+    """
+    Property defaults that can be overridden with environment variables, read in a single pass.
+    """
+    env = os.environ
+    return {
+        "category": env.get("MIXER_CATEGORY", "Mixer"),
+        "vrtist_category": env.get("VRTIST_CATEGORY", "VRtist"),
+        "host": env.get("VRTIST_HOST", common.DEFAULT_HOST),
+        "port": int(env.get("VRTIST_PORT", common.DEFAULT_PORT)),
+        "room": "RM_" + (env.get("VRTIST_ROOM") or getuser()),
+        "vrtist_protocol": env.get("MIXER_VRTIST_PROTOCOL") == "0",
+        "VRtist": env.get("VRTIST_EXE", "D:/unity/VRtist/Build/VRtist.exe"),
+        "no_start_server": env.get("MIXER_NO_START_SERVER") is not None,
+        "data_directory": env.get("MIXER_DATA_DIR"),
+    }
+
+
+_env_defaults = environment_defaults()
+
+
 class SharedFolderItem(bpy.types.PropertyGroup):
     shared_folder: bpy.props.StringProperty(default="", subtype="DIR_PATH", name="Shared Folder")
 
@@ -72,19 +94,19 @@ class MixerPreferences(bpy.types.AddonPreferences):
     def on_user_color_changed(self, context):
         client = share_data.client
         if client and client.is_connected():
-            client.set_client_attributes({ClientAttributes.USERCOLOR: list(self.color)})
+            client.set_client_attributes({ClientAttributes.USERCOLOR: self.color[:]})
 
     category: bpy.props.StringProperty(
         name="Tab Category",
         description="Choose a name for the category of the panel.",
-        default=os.environ.get("MIXER_CATEGORY", "Mixer"),
+        default=_env_defaults["category"],
         update=update_panels_category,
     )
 
     vrtist_category: bpy.props.StringProperty(
         name="Tab Category",
         description="VRtist Panel.",
-        default=os.environ.get("VRTIST_CATEGORY", "VRtist"),
+        default=_env_defaults["vrtist_category"],
         update=update_panels_category,
     )
 
@@ -99,16 +121,16 @@ class MixerPreferences(bpy.types.AddonPreferences):
         default="MIXER",
     )
 
-    host: bpy.props.StringProperty(
-        name="Host", description="Server Host Name", default=os.environ.get("VRTIST_HOST", common.DEFAULT_HOST)
-    )
+    host: bpy.props.StringProperty(name="Host", description="Server Host Name", default=_env_defaults["host"])
     port: bpy.props.IntProperty(
         name="Port",
         description="Port to use to connect the server host",
-        default=int(os.environ.get("VRTIST_PORT", common.DEFAULT_PORT)),
+        default=_env_defaults["port"],
     )
     room: bpy.props.StringProperty(
-        name="Room", description="Name of the session room", default="RM_" + os.environ.get("VRTIST_ROOM", getuser())
+        name="Room",
+        description="Name of the session room",
+        default=_env_defaults["room"],
     )
 
     # User name as displayed in peers user list
@@ -138,7 +160,7 @@ class MixerPreferences(bpy.types.AddonPreferences):
     )
 
     def get_log_level(self):
-        return logging.getLogger(__package__).level
+        return _package_logger.level
 
     log_level: bpy.props.EnumProperty(
         name="Log Level",
@@ -153,21 +175,17 @@ class MixerPreferences(bpy.types.AddonPreferences):
         get=get_log_level,
     )
 
-    vrtist_protocol: bpy.props.BoolProperty(
-        name="VRtist Protocol", default=os.environ.get("MIXER_VRTIST_PROTOCOL") == "0"
-    )
+    vrtist_protocol: bpy.props.BoolProperty(name="VRtist Protocol", default=_env_defaults["vrtist_protocol"])
 
     ignore_version_check: bpy.props.BoolProperty(default=False, name="Ignore Room Version Check")
 
     show_server_console: bpy.props.BoolProperty(name="Show Server Console", default=False)
 
-    VRtist: bpy.props.StringProperty(
-        name="VRtist", default=os.environ.get("VRTIST_EXE", "D:/unity/VRtist/Build/VRtist.exe"), subtype="FILE_PATH"
-    )
+    VRtist: bpy.props.StringProperty(name="VRtist", default=_env_defaults["VRtist"], subtype="FILE_PATH")
     VRtist_suffix: bpy.props.StringProperty(name="VRtist_suffix", default="_VRtist")
 
     data_directory: bpy.props.StringProperty(
-        name="Data Directory", default=os.environ.get("MIXER_DATA_DIR", get_data_directory()), subtype="FILE_PATH"
+        name="Data Directory", default=_env_defaults["data_directory"] or get_data_directory(), subtype="FILE_PATH"
     )
 
     shared_folders: bpy.props.CollectionProperty(name="Shared Folders", type=SharedFolderItem)
@@ -177,7 +195,7 @@ class MixerPreferences(bpy.types.AddonPreferences):
     # Main usage: optimization of client timers to check if updates are required
     no_send_scene_content: bpy.props.BoolProperty(name="Do Not Send Scene Content", default=False)
     no_start_server: bpy.props.BoolProperty(
-        name="Do Not Start Server on Connect", default=os.environ.get("MIXER_NO_START_SERVER") is not None
+        name="Do Not Start Server on Connect", default=_env_defaults["no_start_server"]
     )
     send_base_meshes: bpy.props.BoolProperty(default=True)
     send_baked_meshes: bpy.props.BoolProperty(default=True)
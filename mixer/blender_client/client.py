@@ -38,7 +38,7 @@ import os
 import struct
 import time
 import traceback
-from typing import Dict, Tuple, Optional
+from typing import Dict, List, Tuple, Optional
 from enum import IntEnum
 
 import bpy
@@ -181,6 +181,13 @@ class BlenderClient(Client):
         else:
             super().add_command(command)
 
+    def add_commands(self, commands: List[common.Command]):
+        if self.synced_time_messages:
+            for command in commands:
+                self.add_command(command)
+        else:
+            super().add_commands(commands)
+
     # returns the path of an object
     def get_object_path(self, obj):
         return mixer.blender_client.misc.get_object_path(obj)
@@ -993,7 +1000,10 @@ class BlenderClient(Client):
                     # because it can lead to ignoring real updates when a false positive is encountered
                     command_triggers_depsgraph_update = True
 
-                    if command.type == MessageType.GREASE_PENCIL_MESH:
+                    collection_handler = collection_api.HANDLERS.get(command.type)
+                    if collection_handler is not None:
+                        collection_handler(command.data)
+                    elif command.type == MessageType.GREASE_PENCIL_MESH:
                         grease_pencil_api.build_grease_pencil_mesh(command.data)
                     elif command.type == MessageType.GREASE_PENCIL_MATERIAL:
                         grease_pencil_api.build_grease_pencil_material(command.data)
@@ -1032,23 +1042,6 @@ class BlenderClient(Client):
                     elif command.type == MessageType.TEXTURE:
                         self.build_texture_file(command.data)
 
-                    elif command.type == MessageType.COLLECTION:
-                        collection_api.build_collection(command.data)
-                    elif command.type == MessageType.COLLECTION_REMOVED:
-                        collection_api.build_collection_removed(command.data)
-
-                    elif command.type == MessageType.INSTANCE_COLLECTION:
-                        collection_api.build_collection_instance(command.data)
-
-                    elif command.type == MessageType.ADD_COLLECTION_TO_COLLECTION:
-                        collection_api.build_collection_to_collection(command.data)
-                    elif command.type == MessageType.REMOVE_COLLECTION_FROM_COLLECTION:
-                        collection_api.build_remove_collection_from_collection(command.data)
-                    elif command.type == MessageType.ADD_OBJECT_TO_COLLECTION:
-                        collection_api.build_add_object_to_collection(command.data)
-                    elif command.type == MessageType.REMOVE_OBJECT_FROM_COLLECTION:
-                        collection_api.build_remove_object_from_collection(command.data)
-
                     elif command.type == MessageType.ADD_COLLECTION_TO_SCENE:
                         scene_api.build_collection_to_scene(command.data)
                     elif command.type == MessageType.REMOVE_COLLECTION_FROM_SCENE:
@@ -1252,10 +1245,9 @@ def clear_scene_content():
             "worlds",
         ]
 
-        for name in data:
-            collection = getattr(bpy.data, name)
-            for datablock in collection:
-                collection.remove(datablock)
+        # a single batch_remove() is much faster than one collection.remove() per datablock
+        datablocks = [datablock for name in data for datablock in getattr(bpy.data, name)]
+        bpy.data.batch_remove(datablocks)
 
         bpy.data.batch_remove(bpy.data.shape_keys.values())
         bpy.data.batch_remove(bpy.data.libraries.values())
@@ -16,6 +16,8 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
 import logging
+from typing import Callable, Dict, Iterable, List, Optional
+
 import bpy
 
 from mixer.broadcaster import common
@@ -24,22 +26,55 @@ from mixer.share_data import share_data
 
 logger = logging.getLogger(__name__)
 
+_encode_string = common.encode_string
+_encode_bool = common.encode_bool
+_encode_vector3 = common.encode_vector3
+_Command = common.Command
+_MT_COLLECTION = common.MessageType.COLLECTION
+_MT_COLLECTION_REMOVED = common.MessageType.COLLECTION_REMOVED
+_MT_ADD_COLLECTION_TO_COLLECTION = common.MessageType.ADD_COLLECTION_TO_COLLECTION
+_MT_REMOVE_COLLECTION_FROM_COLLECTION = common.MessageType.REMOVE_COLLECTION_FROM_COLLECTION
+_MT_ADD_OBJECT_TO_COLLECTION = common.MessageType.ADD_OBJECT_TO_COLLECTION
+_MT_REMOVE_OBJECT_FROM_COLLECTION = common.MessageType.REMOVE_OBJECT_FROM_COLLECTION
+_MT_INSTANCE_COLLECTION = common.MessageType.INSTANCE_COLLECTION
+
+
+def send_commands(client: Client, commands: Iterable[common.Command]):
+    """
+    Submit commands built by the send_* functions below with out=commands, in a single call.
+    """
+    commands = list(commands)
+    if commands:
+        client.add_commands(commands)
+
+
+def _submit(client: Client, command: common.Command, out: Optional[List[common.Command]]):
+    if out is None:
+        client.add_command(command)
+    else:
+        out.append(command)
+
 
-def send_collection(client: Client, collection: bpy.types.Collection):
-    logger.info("send_collection %s", collection.name_full)
+def send_collection(client: Client, collection: bpy.types.Collection, out: Optional[List[common.Command]] = None):
+    name_full = collection.name_full
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("send_collection %s", name_full)
+    hide_viewport = collection.hide_viewport
     collection_instance_offset = collection.instance_offset
     temporary_visibility = True
-    layer_collection = share_data.blender_layer_collections.get(collection.name_full)
+    layer_collection = share_data.blender_layer_collections.get(name_full)
     if layer_collection:
         temporary_visibility = not layer_collection.hide_viewport
 
-    buffer = (
-        common.encode_string(collection.name_full)
-        + common.encode_bool(not collection.hide_viewport)
-        + common.encode_vector3(collection_instance_offset)
-        + common.encode_bool(temporary_visibility)
+    buffer = b"".join(
+        (
+            _encode_string(name_full),
+            _encode_bool(not hide_viewport),
+            _encode_vector3(collection_instance_offset),
+            _encode_bool(temporary_visibility),
+        )
     )
-    client.add_command(common.Command(common.MessageType.COLLECTION, buffer, 0))
+    _submit(client, _Command(_MT_COLLECTION, buffer, 0), out)
 
 
 def build_collection(data):
@@ -57,11 +92,12 @@ def build_collection(data):
     offset, index = common.decode_vector3(data, index)
     temporary_visibility, index = common.decode_bool(data, index)
 
-    logger.info("build_collection %s", name_full)
-    collection = share_data.blender_collections.get(name_full)
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("build_collection %s", name_full)
+    collections = share_data.blender_collections
+    collection = collections.get(name_full)
     if collection is None:
-        collection = bpy.data.collections.new(name_full)
-        share_data.blender_collections[name_full] = collection
+        collection = collections[name_full] = bpy.data.collections.new(name_full)
 
     collection.hide_viewport = hide_viewport
     collection.instance_offset = offset
@@ -74,10 +110,11 @@ def build_collection(data):
         share_data.blender_collection_temporary_visibility[name_full] = temporary_visibility
 
 
-def send_collection_removed(client: Client, collection_name):
-    logger.info("send_collection_removed %s", collection_name)
-    buffer = common.encode_string(collection_name)
-    client.add_command(common.Command(common.MessageType.COLLECTION_REMOVED, buffer, 0))
+def send_collection_removed(client: Client, collection_name, out: Optional[List[common.Command]] = None):
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("send_collection_removed %s", collection_name)
+    buffer = _encode_string(collection_name)
+    _submit(client, _Command(_MT_COLLECTION_REMOVED, buffer, 0), out)
 
 
 def build_collection_removed(data):
@@ -90,7 +127,8 @@ def build_collection_removed(data):
         return
 
     # Blender/Blender in VRtist (non generic) mode
-    logger.info("build_collectionRemove %s", name_full)
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("build_collectionRemove %s", name_full)
     collection = share_data.blender_collections.get(name_full)
     if collection:
         # otherwise already removed by Blender protocol
@@ -102,16 +140,18 @@ def build_collection_removed(data):
             logger.info(f"... {e!r} ")
 
 
-def send_add_collection_to_collection(client: Client, parent_collection_name, collection_name):
-    logger.info("send_add_collection_to_collection %s <- %s", parent_collection_name, collection_name)
+def send_add_collection_to_collection(
+    client: Client, parent_collection_name, collection_name, out: Optional[List[common.Command]] = None
+):
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("send_add_collection_to_collection %s <- %s", parent_collection_name, collection_name)
 
-    buffer = common.encode_string(parent_collection_name) + common.encode_string(collection_name)
-    client.add_command(common.Command(common.MessageType.ADD_COLLECTION_TO_COLLECTION, buffer, 0))
+    buffer = b"".join((_encode_string(parent_collection_name), _encode_string(collection_name)))
+    _submit(client, _Command(_MT_ADD_COLLECTION_TO_COLLECTION, buffer, 0), out)
 
 
 def build_collection_to_collection(data):
-    parent_name, index = common.decode_string(data, 0)
-    child_name, _ = common.decode_string(data, index)
+    parent_name, child_name, _ = common.decode_string_pair(data)
 
     # This message is not emitted by VRtist, only by Blender, so it is used only for Blender/Blender sync.
     # In generic mode, it conflicts with generic messages, so drop it
@@ -119,10 +159,13 @@ def build_collection_to_collection(data):
         logger.warning("build_collection_to_collection %s <- %s, ignore in generic mode", parent_name, child_name)
         return
 
-    logger.info("build_collection_to_collection %s <- %s", parent_name, child_name)
-    parent = share_data.blender_collections[parent_name]
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("build_collection_to_collection %s <- %s", parent_name, child_name)
 
-    child = share_data.blender_collections[child_name]
+    # blender_collections is a property, evaluate it once
+    collections = share_data.blender_collections
+    parent = collections[parent_name]
+    child = collections[child_name]
 
     try:
         parent.children.link(child)
@@ -139,16 +182,18 @@ def build_collection_to_collection(data):
             logger.warning(f"... {e!r}")
 
 
-def send_remove_collection_from_collection(client: Client, parent_collection_name, collection_name):
-    logger.info("send_remove_collection_from_collection %s <- %s", parent_collection_name, collection_name)
+def send_remove_collection_from_collection(
+    client: Client, parent_collection_name, collection_name, out: Optional[List[common.Command]] = None
+):
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("send_remove_collection_from_collection %s <- %s", parent_collection_name, collection_name)
 
-    buffer = common.encode_string(parent_collection_name) + common.encode_string(collection_name)
-    client.add_command(common.Command(common.MessageType.REMOVE_COLLECTION_FROM_COLLECTION, buffer, 0))
+    buffer = b"".join((_encode_string(parent_collection_name), _encode_string(collection_name)))
+    _submit(client, _Command(_MT_REMOVE_COLLECTION_FROM_COLLECTION, buffer, 0), out)
 
 
 def build_remove_collection_from_collection(data):
-    parent_name, index = common.decode_string(data, 0)
-    child_name, _ = common.decode_string(data, index)
+    parent_name, child_name, _ = common.decode_string_pair(data)
 
     # This message is not emitted by VRtist, only by Blender, so it is used only for Blender/Blender sync.
     # In generic mode, it conflicts with generic messages, so drop it
@@ -158,48 +203,55 @@ def build_remove_collection_from_collection(data):
         )
         return
 
-    logger.info("build_remove_collection_from_collection %s <- %s", parent_name, child_name)
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("build_remove_collection_from_collection %s <- %s", parent_name, child_name)
 
-    parent = share_data.blender_collections[parent_name]
-    child = share_data.blender_collections[child_name]
+    collections = share_data.blender_collections
+    parent = collections[parent_name]
+    child = collections[child_name]
     parent.children.unlink(child)
 
 
-def send_add_object_to_collection(client: Client, collection_name, obj_name):
-    logger.info("send_add_object_to_collection %s <- %s", collection_name, obj_name)
-    buffer = common.encode_string(collection_name) + common.encode_string(obj_name)
-    client.add_command(common.Command(common.MessageType.ADD_OBJECT_TO_COLLECTION, buffer, 0))
+def send_add_object_to_collection(
+    client: Client, collection_name, obj_name, out: Optional[List[common.Command]] = None
+):
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("send_add_object_to_collection %s <- %s", collection_name, obj_name)
+    buffer = b"".join((_encode_string(collection_name), _encode_string(obj_name)))
+    _submit(client, _Command(_MT_ADD_OBJECT_TO_COLLECTION, buffer, 0), out)
 
 
 def build_add_object_to_collection(data):
-    collection_name, index = common.decode_string(data, 0)
-    object_name, _ = common.decode_string(data, index)
+    collection_name, object_name, _ = common.decode_string_pair(data)
 
     # This message is not emitted by VRtist, only by Blender, so it is used only for Blender/Blender sync.
     # In generic mode, it conflicts with generic messages, so drop it
     if not share_data.use_vrtist_protocol():
         logger.warning("build_add_object_to_collection %s <- %s, ignore in generic mode", collection_name, object_name)
         return
-    logger.info("build_add_object_to_collection %s <- %s", collection_name, object_name)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("build_add_object_to_collection %s <- %s", collection_name, object_name)
 
-    collection = share_data.blender_collections[collection_name]
+    collection_objects = share_data.blender_collections[collection_name].objects
 
     # We may have received an object creation message before this collection link message
     # and object creation will have created and linked the collection if needed
-    if collection.objects.get(object_name) is None:
+    if collection_objects.get(object_name) is None:
         object_ = share_data.blender_objects[object_name]
-        collection.objects.link(object_)
+        collection_objects.link(object_)
 
 
-def send_remove_object_from_collection(client: Client, collection_name, obj_name):
-    logger.info("send_remove_object_from_collection %s <- %s", collection_name, obj_name)
-    buffer = common.encode_string(collection_name) + common.encode_string(obj_name)
-    client.add_command(common.Command(common.MessageType.REMOVE_OBJECT_FROM_COLLECTION, buffer, 0))
+def send_remove_object_from_collection(
+    client: Client, collection_name, obj_name, out: Optional[List[common.Command]] = None
+):
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("send_remove_object_from_collection %s <- %s", collection_name, obj_name)
+    buffer = b"".join((_encode_string(collection_name), _encode_string(obj_name)))
+    _submit(client, _Command(_MT_REMOVE_OBJECT_FROM_COLLECTION, buffer, 0), out)
 
 
 def build_remove_object_from_collection(data):
-    collection_name, index = common.decode_string(data, 0)
-    object_name, _ = common.decode_string(data, index)
+    collection_name, object_name, _ = common.decode_string_pair(data)
 
     # This message is not emitted by VRtist, only by Blender, so it is used only for Blender/Blender sync.
     # In generic mode, it conflicts with generic messages, so drop it
@@ -209,31 +261,32 @@ def build_remove_object_from_collection(data):
         )
         return
 
-    logger.info("build_remove_object_from_collection %s <- %s", collection_name, object_name)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("build_remove_object_from_collection %s <- %s", collection_name, object_name)
 
-    collection = share_data.blender_collections[collection_name]
     object_ = share_data.blender_objects.get(object_name)
     if object_:
         # otherwise already removed by Blender protocol
+        collection_objects = share_data.blender_collections[collection_name].objects
         try:
-            collection.objects.unlink(object_)
+            collection_objects.unlink(object_)
         except Exception as e:
             logger.info("build_remove_object_from_collection: exception during unlink... ")
             logger.info(f"... {e!r} ")
 
 
-def send_collection_instance(client: Client, obj):
-    if not obj.instance_collection:
+def send_collection_instance(client: Client, obj, out: Optional[List[common.Command]] = None):
+    instance_collection = obj.instance_collection
+    if instance_collection is None:
         return
     instance_name = obj.name_full
-    instanciated_collection = obj.instance_collection.name_full
-    buffer = common.encode_string(instance_name) + common.encode_string(instanciated_collection)
-    client.add_command(common.Command(common.MessageType.INSTANCE_COLLECTION, buffer, 0))
+    instanciated_collection = instance_collection.name_full
+    buffer = b"".join((_encode_string(instance_name), _encode_string(instanciated_collection)))
+    _submit(client, _Command(_MT_INSTANCE_COLLECTION, buffer, 0), out)
 
 
 def build_collection_instance(data):
-    instance_name, index = common.decode_string(data, 0)
-    instantiated_name, _ = common.decode_string(data, index)
+    instance_name, instantiated_name, _ = common.decode_string_pair(data)
 
     # This message is not emitted by VRtist, only by Blender, so it is used only for Blender/Blender sync.
     # In generic mode, it conflicts with generic messages, so drop it
@@ -241,7 +294,8 @@ def build_collection_instance(data):
         logger.warning("build_collection_instance %s <- %s, ignore in generic mode", instantiated_name, instance_name)
         return
 
-    logger.info("build_collection_instance %s from %s", instantiated_name, instance_name)
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("build_collection_instance %s from %s", instantiated_name, instance_name)
 
     instantiated = share_data.blender_collections[instantiated_name]
 
@@ -250,3 +304,14 @@ def build_collection_instance(data):
     instance.instance_type = "COLLECTION"
 
     share_data.blender_objects[instance_name] = instance
+
+
+HANDLERS: Dict[common.MessageType, Callable[[bytes], None]] = {
+    common.MessageType.COLLECTION: build_collection,
+    common.MessageType.COLLECTION_REMOVED: build_collection_removed,
+    common.MessageType.INSTANCE_COLLECTION: build_collection_instance,
+    common.MessageType.ADD_COLLECTION_TO_COLLECTION: build_collection_to_collection,
+    common.MessageType.REMOVE_COLLECTION_FROM_COLLECTION: build_remove_collection_from_collection,
+    common.MessageType.ADD_OBJECT_TO_COLLECTION: build_add_object_to_collection,
+    common.MessageType.REMOVE_OBJECT_FROM_COLLECTION: build_remove_object_from_collection,
+}
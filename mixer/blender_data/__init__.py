@@ -39,13 +39,23 @@ except (ImportError, AttributeError):
     pass
 
 
+_registered = False
+
+
 def register():
+    global _registered
+    if _registered:
+        # also called by the test scripts, after the add-on registration
+        return
+
     import bpy
     from mixer.blender_data.bpy_data import collections_types
 
     for type_ in collections_types():
         type_.mixer_uuid = bpy.props.StringProperty(default="")
+    _registered = True
 
 
 def unregister():
-    pass
+    global _registered
+    _registered = False
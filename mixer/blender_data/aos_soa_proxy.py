@@ -51,7 +51,9 @@ def soa_initializer(attr_type, length):
     # TODO try to be smart
     element_init = soa_initializers[attr_type]
     if isinstance(element_init, array.array):
-        return array.array(element_init.typecode, element_init.tolist() * length)
+        # sequence repetition of the single element initializer allocates the whole buffer at once without
+        # building an intermediate list
+        return element_init * length
     elif isinstance(element_init, list):
         return element_init * length
 
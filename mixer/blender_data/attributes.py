@@ -38,6 +38,9 @@ MAX_DEPTH = 30
 
 _builtin_types = (float, int, bool, str, bytes)
 
+_datablock_ref_collection_types = (type(T.CollectionObjects.bl_rna), type(T.CollectionChildren.bl_rna))
+"""RNA types of the collections loaded into a DatablockRefCollectionProxy"""
+
 
 class _NotBuiltin(Exception):
     pass
@@ -81,9 +84,7 @@ def read_attribute(attr: Any, key: Union[int, str], attr_property: T.Property, p
 
         attr_type = type(attr)
         if attr_type == T.bpy_prop_collection:
-            if hasattr(attr, "bl_rna") and isinstance(
-                attr.bl_rna, (type(T.CollectionObjects.bl_rna), type(T.CollectionChildren.bl_rna))
-            ):
+            if isinstance(getattr(attr, "bl_rna", None), _datablock_ref_collection_types):
                 from mixer.blender_data.datablock_collection_proxy import DatablockRefCollectionProxy
 
                 return DatablockRefCollectionProxy().load(attr, context)
@@ -224,10 +225,12 @@ def write_attribute(
             logger.warning(f" ...{e!r}")
 
     except Exception:
-        logger.warning("write_attribute: exception for ...")
-        logger.warning(f"... attribute: {context.visit_state.display_path()}.{key}, value: {value}")
-        for line in traceback.format_exc().splitlines():
-            logger.warning(f" ... {line}")
+        # this may be hit for many attributes of a malformed datablock. Do not format the traceback if it is not logged
+        if logger.isEnabledFor(logging.WARNING):
+            logger.warning("write_attribute: exception for ...")
+            logger.warning(f"... attribute: {context.visit_state.display_path()}.{key}, value: {value}")
+            for line in traceback.format_exc().splitlines():
+                logger.warning(f" ... {line}")
 
 
 def apply_attribute(
@@ -22,12 +22,11 @@ See synchronization.md
 """
 from __future__ import annotations
 
-from collections import defaultdict
 from dataclasses import dataclass, field
-from itertools import islice
+from itertools import chain, islice
 import logging
 import sys
-from typing import Any, Callable, Dict, List, Optional, Set, Tuple, TYPE_CHECKING, Union
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple, TYPE_CHECKING, Union
 import pathlib
 
 import bpy
@@ -61,6 +60,8 @@ class ProxyState:
     State of a BpyDataProxy
     """
 
+    __slots__ = ("proxies", "_datablocks", "objects", "unresolved_refs", "unregistered_libraries", "shared_folders")
+
     def __init__(self):
         self.proxies: Dict[Uuid, DatablockProxy] = {}
         """Known proxies"""
@@ -68,8 +69,9 @@ class ProxyState:
         self._datablocks: Dict[Uuid, T.ID] = {}
         """Known datablocks"""
 
-        self.objects: Dict[Uuid, Set[Uuid]] = defaultdict(set)
-        """Object.data uuid : (set of uuids of Object using object.data). Mostly used for shape keys"""
+        self.objects: Dict[Uuid, Union[Uuid, Set[Uuid]]] = {}
+        """Object.data uuid : uuid of the Object using object.data, or set of uuids if there are several.
+        Mostly used for shape keys. Use object_uuids() to read"""
 
         self.unresolved_refs: UnresolvedRefs = UnresolvedRefs()
 
@@ -83,7 +85,39 @@ class ProxyState:
         if datablock.data is not None:
             data_uuid = datablock.data.mixer_uuid
             object_uuid = datablock.mixer_uuid
-            self.objects[data_uuid].add(object_uuid)
+            self._add_user(data_uuid, object_uuid)
+
+    def _add_user(self, data_uuid: Uuid, object_uuid: Uuid):
+        # most Object.data have a single user, do not allocate a set for them
+        users = self.objects.get(data_uuid)
+        if users is None:
+            self.objects[data_uuid] = object_uuid
+        elif isinstance(users, str):
+            if users != object_uuid:
+                self.objects[data_uuid] = {users, object_uuid}
+        else:
+            users.add(object_uuid)
+
+    def _remove_user(self, data_uuid: Uuid, object_uuid: Uuid):
+        users = self.objects.get(data_uuid)
+        if users is None:
+            return
+        if isinstance(users, str):
+            if users == object_uuid:
+                del self.objects[data_uuid]
+        else:
+            users.discard(object_uuid)
+            if len(users) == 1:
+                self.objects[data_uuid] = next(iter(users))
+
+    def object_uuids(self, data_uuid: Uuid) -> Iterable[Uuid]:
+        """Returns the uuids of the Object datablocks that use the datablock with uuid data_uuid as Object.data"""
+        users = self.objects.get(data_uuid)
+        if users is None:
+            return ()
+        if isinstance(users, str):
+            return (users,)
+        return users
 
     def datablock(self, uuid: Uuid) -> Optional[T.ID]:
         datablock = self._datablocks.get(uuid)
@@ -108,7 +142,7 @@ class ProxyState:
         del self._datablocks[uuid]
 
     def objects_using_data(self, data_datablock: T.ID) -> List[T.ID]:
-        objects = [self.datablock(uuid) for uuid in self.objects[data_datablock.mixer_uuid]]
+        objects = [self.datablock(uuid) for uuid in self.object_uuids(data_datablock.mixer_uuid)]
         return [object for object in objects if object is not None]
 
 
@@ -129,9 +163,19 @@ class VisitState:
     _MAX_DEPTH = 30
     """Maximum nesting level, to guard against unfiltered circular references."""
 
+    __slots__ = (
+        "datablock_proxy",
+        "_attribute_path",
+        "dirty_vertex_groups",
+        "send_nodetree_links",
+        "datablock_string",
+    )
+
     class CurrentDatablockContext:
         """Context manager to keep track of the current standalone datablock"""
 
+        __slots__ = ("_visit_state", "_is_embedded_data", "_datablock_string", "_proxy")
+
         def __init__(self, visit_state: VisitState, proxy: DatablockProxy, datablock: T.ID):
             self._visit_state = visit_state
             self._is_embedded_data = datablock.is_embedded_data
@@ -271,11 +315,6 @@ _creation_order = {
 }
 
 
-def _creation_order_predicate(item: Tuple[str, Any]) -> int:
-    # item (bpy.data collection name, delta)
-    return _creation_order.get(item[0], 0)
-
-
 _updates_order = {
     # before Mesh for shape keys
     T.Key: 5,
@@ -289,10 +328,6 @@ _updates_order = {
 }
 
 
-def _updates_order_predicate(datablock: T.ID) -> int:
-    return _updates_order.get(type(datablock), sys.maxsize)
-
-
 _removal_order = {
     # remove Object before its data otherwise data is removed at the time the Object is removed
     # and the data removal fails
@@ -301,8 +336,36 @@ _removal_order = {
 }
 
 
-def _remove_order_predicate(removal: Removal) -> int:
-    return _removal_order.get(removal[1], sys.maxsize)
+# The sort helpers below decorate the items with their order key in a single pass. The item index breaks ties,
+# which keeps the sort stable and avoids comparing the items themselves.
+
+
+def _sort_creations(collection_deltas: List[Tuple[str, Any]]) -> List[Tuple[str, Any]]:
+    # items (bpy.data collection name, delta)
+    get = _creation_order.get
+    keyed = [(get(item[0], 0), i, item) for i, item in enumerate(collection_deltas)]
+    keyed.sort()
+    return [item for _, _, item in keyed]
+
+
+def _sort_updates(datablocks: Iterable[T.ID]) -> List[T.ID]:
+    get = _updates_order.get
+    maxsize = sys.maxsize
+    keyed = [(get(type(datablock), maxsize), i, datablock) for i, datablock in enumerate(datablocks)]
+    keyed.sort()
+    return [datablock for _, _, datablock in keyed]
+
+
+def _sort_removals(removals: Iterable[Removal]) -> List[Removal]:
+    get = _removal_order.get
+    maxsize = sys.maxsize
+    keyed = [(get(removal[1], maxsize), i, removal) for i, removal in enumerate(removals)]
+    keyed.sort()
+    return [removal for _, _, removal in keyed]
+
+
+_is_safe_update_type: Dict[type, bool] = {}
+"""Whether a concrete datablock type is a subclass of one of safe_depsgraph_updates, filled on first use"""
 
 
 def retain(arg):
@@ -436,36 +499,53 @@ class BpyDataProxy(Proxy):
         # shared state between updated datablock proxies
         context = self.context(synchronized_properties)
 
-        deltas = sorted(diff.collection_deltas, key=_creation_order_predicate)
+        deltas = _sort_creations(diff.collection_deltas)
+        removals = []
         for delta_name, delta in deltas:
             collection_changeset = self._data[delta_name].update(delta, context)
             changeset.creations.extend(collection_changeset.creations)
-            changeset.removals.extend(collection_changeset.removals)
+            removals.append(collection_changeset.removals)
             changeset.renames.extend(collection_changeset.renames)
 
         # Everything is sorted with Object last, but the removals need to be sorted the other way round,
         # otherwise the receiver might get a Mesh remove (that removes the Object as well), then an Object remove
         # message for a non existent objjet that triggers a noisy warning, otherwise useful
-        changeset.removals = sorted(changeset.removals, key=_remove_order_predicate)
+        changeset.removals = _sort_removals(chain.from_iterable(removals))
 
         all_updates = updates
         if process_delayed_updates:
             for f in self._delayed_remote_updates:
                 f()
             self._delayed_remote_updates.clear()
-            all_updates |= {self.state.datablock(uuid) for uuid in self._delayed_local_updates}
+            # delayed updates are kept as uuids, not as datablock references that may be stale after an undo.
+            # Skip the uuids whose datablock was removed in the meantime
+            state = self.state
+            for uuid in self._delayed_local_updates:
+                datablock = state.datablock(uuid)
+                if datablock is not None:
+                    all_updates.add(datablock)
             self._delayed_local_updates.clear()
 
-        sorted_updates = sorted(all_updates, key=_updates_order_predicate)
+        sorted_updates = _sort_updates(all_updates)
 
+        proxies_get = self.state.proxies.get
+        updates_append = changeset.updates.append
+        is_safe_type_get = _is_safe_update_type.get
         for datablock in sorted_updates:
-            if not isinstance(datablock, safe_depsgraph_updates):
+            datablock_type = type(datablock)
+            is_safe = is_safe_type_get(datablock_type)
+            if is_safe is None:
+                # e.g. PointLight for Light
+                is_safe = _is_safe_update_type[datablock_type] = issubclass(datablock_type, safe_depsgraph_updates)
+            if not is_safe:
                 logger.info("depsgraph update: ignoring untracked type %r", datablock)
                 continue
-            if isinstance(datablock, T.Scene) and datablock.name == "_mixer_to_be_removed_":
-                logger.error(f"Skipping scene {datablock.name} uuid: '{datablock.mixer_uuid}'")
+            name = datablock.name
+            uuid = datablock.mixer_uuid
+            if isinstance(datablock, T.Scene) and name == "_mixer_to_be_removed_":
+                logger.error(f"Skipping scene {name} uuid: '{uuid}'")
                 continue
-            proxy = self.state.proxies.get(datablock.mixer_uuid)
+            proxy = proxies_get(uuid)
             if proxy is None:
                 # Not an error for embedded IDs.
                 if not datablock.is_embedded_data:
@@ -478,12 +558,12 @@ class BpyDataProxy(Proxy):
                     # However, it is not obvious to detect the safe cases and remove the message in such cases
                     logger.info("depsgraph update: Ignoring embedded %r", datablock)
                 continue
-            delta = proxy.diff(datablock, datablock.name, None, context)
+            delta = proxy.diff(datablock, name, None, context)
             if delta:
                 logger.info("depsgraph update: update %r", datablock)
                 # TODO add an apply mode to diff instead to avoid two traversals ?
                 proxy.apply_to_proxy(datablock, delta, context)
-                changeset.updates.append(delta)
+                updates_append(delta)
             else:
                 logger.debug("depsgraph update: ignore empty delta %r", datablock)
 
@@ -528,7 +608,8 @@ class BpyDataProxy(Proxy):
         """
         Process a received datablock removal command, removing the datablock and updating the proxy state
         """
-        proxy = self.state.proxies.get(uuid)
+        state = self.state
+        proxy = state.proxies.get(uuid)
         if proxy is None:
             logger.error(f"remove_datablock(): no proxy for {uuid}")
             return
@@ -538,7 +619,7 @@ class BpyDataProxy(Proxy):
             logger.warning(f"remove_datablock: no bpy_data_collection_proxy with name {proxy.collection_name} ")
             return None
 
-        datablock = self.state.datablock(uuid)
+        datablock = state.datablock(uuid)
 
         if isinstance(datablock, T.Object) and datablock.data is not None:
             data_uuid = datablock.data.mixer_uuid
@@ -549,15 +630,12 @@ class BpyDataProxy(Proxy):
 
         if data_uuid is not None:
             # removed an Object
-            self.state.objects[data_uuid].remove(uuid)
+            state._remove_user(data_uuid, uuid)
         else:
-            try:
-                # maybe removed an Object.data pointee
-                del self.state.objects[uuid]
-            except KeyError:
-                pass
-        del self.state.proxies[uuid]
-        del self.state._datablocks[uuid]
+            # maybe removed an Object.data pointee
+            state.objects.pop(uuid, None)
+        del state.proxies[uuid]
+        del state._datablocks[uuid]
 
     @retain([])
     def rename_datablocks(self, items: List[Tuple[str, str, str]]) -> RenameChangeset:
@@ -566,9 +644,10 @@ class BpyDataProxy(Proxy):
         (receiver side)
         """
         rename_changeset_to_send: RenameChangeset = []
-        renames = []
+        renames: List[Tuple[DatablockCollectionProxy, DatablockProxy, str, str, str, T.ID]] = []
+        proxies_get = self.state.proxies.get
         for uuid, old_name, new_name in items:
-            proxy = self.state.proxies.get(uuid)
+            proxy = proxies_get(uuid)
             if proxy is None:
                 logger.error(f"rename_datablocks(): no proxy for {uuid} (debug info)")
                 return []
@@ -580,7 +659,8 @@ class BpyDataProxy(Proxy):
 
             datablock = self.state.datablock(uuid)
             tmp_name = f"_mixer_tmp_{uuid}"
-            if datablock.name != new_name and datablock.name != old_name:
+            datablock_name = datablock.name
+            if datablock_name != new_name and datablock_name != old_name:
                 # local receives a rename, but its datablock name does not match the remote datablock name before
                 # the rename. This means that one of these happened:
                 # - local has renamed the datablock and remote will receive the rename command later on
@@ -594,14 +674,14 @@ class BpyDataProxy(Proxy):
                 # Strangely, for collections not everyone always detect a conflict, so rename for everyone
                 rename_changeset_to_send.append(
                     (
-                        datablock.mixer_uuid,
-                        datablock.name,
+                        uuid,
+                        datablock_name,
                         new_name,
-                        f"Conflict bpy.data.{proxy.collection_name}[{datablock.name}] into {new_name}",
+                        f"Conflict bpy.data.{proxy.collection_name}[{datablock_name}] into {new_name}",
                     )
                 )
 
-            renames.append([bpy_data_collection_proxy, proxy, old_name, tmp_name, new_name, datablock])
+            renames.append((bpy_data_collection_proxy, proxy, old_name, tmp_name, new_name, datablock))
 
         # The rename process is handled in two phases to avoid spontaneous renames from Blender
         # see DatablockCollectionProxy.update() for explanation
@@ -616,16 +696,20 @@ class BpyDataProxy(Proxy):
     def diff(self, synchronized_properties: SynchronizedProperties) -> Optional[BpyDataProxy]:
         """Currently for tests only"""
         diff = self.__class__()
+        # only keep the collections with a delta
+        diff._data = {}
         context = self.context(synchronized_properties)
         for name, proxy in self._data.items():
             collection = getattr(bpy.data, name, None)
             if collection is None:
                 logger.warning(f"Unknown, collection bpy.data.{name}")
                 continue
+            if not len(proxy) and not len(collection):
+                continue
             collection_property = bpy.data.bl_rna.properties.get(name)
-            delta = proxy.diff(collection, collection_property, context)
+            delta = proxy.diff(collection, name, collection_property, context)
             if delta is not None:
-                diff._data[name] = diff
+                diff._data[name] = delta
         if len(diff._data):
             return diff
         return None
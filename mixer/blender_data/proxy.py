@@ -179,7 +179,18 @@ class Proxy:
             resolve_delta: If True, and the data is a Delta, will return the delta value
         """
 
-        if isinstance(key_or_path, (int, str)):
+        if isinstance(key_or_path, str):
+            # Fast path for the frequent proxy.data("name"), that does not raise and catch a TypeError from self[key]
+            # as Proxy has no __getitem__. StructCollectionProxy, which has one, overrides data()
+            try:
+                data = self._data[key_or_path]
+            except KeyError:
+                return None
+            if isinstance(data, Delta) and resolve_delta:
+                data = data.value
+            return data
+
+        if isinstance(key_or_path, int):
             key_or_path = (key_or_path,)
 
         data = self
@@ -53,7 +53,7 @@ class ShapeKeyProxy(DatablockProxy):
     def create_shape_key_datablock(self, data_proxy: DatablockProxy, context: Context) -> T.Key:
         # find any Object using the datablock manages by this Proxy
         data_uuid = data_proxy.mixer_uuid
-        objects = context.proxy_state.objects[data_uuid]
+        objects = context.proxy_state.object_uuids(data_uuid)
         if not objects:
             logger.error(
                 f"update_shape_key_datablock: received an update for {context.proxy_state.datablock(self.mixer_uuid)}..."
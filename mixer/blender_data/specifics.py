@@ -30,7 +30,20 @@ import array
 from functools import lru_cache
 import logging
 from pathlib import Path
-from typing import Any, Callable, cast, Dict, ItemsView, List, Optional, Tuple, TYPE_CHECKING, Union
+from typing import (
+    Any,
+    Callable,
+    cast,
+    Dict,
+    FrozenSet,
+    ItemsView,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    TYPE_CHECKING,
+    Union,
+)
 
 from mixer.blender_data.proxy import AddElementFailed, ExternalFileFailed
 
@@ -82,6 +95,9 @@ def _resize_geometry_types():
     )
 
 
+_gpencil_stroke_points_type = type(T.GPencilStrokePoints.bl_rna)
+_spline_bezier_points_type = type(T.SplineBezierPoints.bl_rna)
+
 # in sync with soa_initializers
 soable_properties = (
     T.BoolProperty,
@@ -114,12 +130,16 @@ def dispatch_rna(no_rna_impl: Callable[..., Any]):
     """
     registry: Dict[type, Callable[..., Any]] = {}
 
+    resolved: Dict[type, Callable[..., Any]] = {}
+    """Result of dispatch() for each rna type already seen. Cleared on registration"""
+
     def register_default():
         """Registers the decorated function f as the implementaton to use if the rna of the first argument
         of f was not otherwise registered"""
 
         def decorator(f: Callable[..., Any]):
             registry[type(None)] = f
+            resolved.clear()
             return f
 
         return decorator
@@ -130,6 +150,7 @@ def dispatch_rna(no_rna_impl: Callable[..., Any]):
 
         def decorator(f: Callable[..., Any]):
             registry[class_] = f
+            resolved.clear()
             return f
 
         return decorator
@@ -154,7 +175,10 @@ def dispatch_rna(no_rna_impl: Callable[..., Any]):
         if rna is None:
             func = no_rna_impl
         else:
-            func = dispatch(type(rna))
+            rna_type = type(rna)
+            func = resolved.get(rna_type)
+            if func is None:
+                func = resolved[rna_type] = dispatch(rna_type)
         return func(bpy_prop_collection, *args, **kwargs)
 
     # wrapper.register = register  genarates mypy error
@@ -178,17 +202,9 @@ def dispatch_value(default_func):
 
         return decorator
 
-    def dispatch(value: Any):
-        func = registry.get(value)
-        if func:
-            return func
-
-        return default
-
     def wrapper(value: Any, *args, **kwargs):
         """Calls the function registered for value"""
-        func = dispatch(value)
-        return func(value, *args, **kwargs)
+        return registry.get(value, default)(value, *args, **kwargs)
 
     # wrapper.register = register  genarates mypy error
     setattr(wrapper, "register", register)  # noqa B010
@@ -343,167 +359,225 @@ def _(collection_name: str, proxy: DatablockProxy, context: Context) -> Optional
     return datablock
 
 
-def _filter_properties(properties: ItemsView, exclude_names: List[str]) -> ItemsView:
-    filtered = {k: v for k, v in properties if k not in exclude_names}
-    return filtered.items()
+_CURVE_MAPPING = frozenset(("curve_mapping",))
+_INSTANCE_COLLECTION = frozenset(("instance_collection",))
+_TEXSPACE = frozenset(("texspace_location", "texspace_size"))
+_WIDTH_HIDDEN = frozenset(("width_hidden",))
+# NodeReroute.width cannot be set !!
+_REROUTE_WIDTH_HIDDEN = frozenset(("width_hidden", "width"))
+# For nodes of type NodeGroupInput and NodeGroupOutput, do not save inputs and outputs,
+# which are created created/updated via NodeTree.inputs and NoteTree.outputs
+_GROUP_IO = frozenset(("inputs", "outputs"))
+_GROUP_IO_WIDTH_HIDDEN = _GROUP_IO | _WIDTH_HIDDEN
+# saving bl_idname for NodeReroute (and others ?) cause havoc
+_SOCKET_IDENTIFIERS = frozenset(("identifier", "bl_idname"))
+_NAME = frozenset(("name",))
+_EXCLUDE = frozenset(("exclude",))
+_UNITS = frozenset(("length_unit", "mass_unit", "time_unit", "temperature_unit"))
+# FCurve.group = None
+# triggers noisy message
+# ERROR: one of the ID's for the groups to assign to is invalid (ptr=0000028B55B0C038, val=0000000000000000)
+_GROUP = frozenset(("group",))
+_CROP = frozenset(("crop",))
+_TRANSFORM = frozenset(("transform",))
+_CROP_TRANSFORM = _CROP | _TRANSFORM
 
 
-@dispatch_rna
-def conditional_properties(bpy_struct: T.Struct, properties: ItemsView) -> ItemsView:
-    """Filter properties list according to a specific property value in the same structure.
+def _filter_properties(properties: ItemsView, exclude_names: FrozenSet[str]) -> Iterable[Tuple[str, T.Property]]:
+    return ((k, v) for k, v in properties if k not in exclude_names)
 
-    This prevents loading values that cannot always be saved, such as Object.instance_collection
-    that can only be saved when Object.data is None
 
-    Args:
-        bpy_struct: the structure
-        properties: a view into a Dict[str, bpy.types.Property] to filter
-    Returns:
-        The filtered properties
-    """
-    return properties
+def _color_managed_view_settings_filter(bpy_struct: T.Struct) -> Optional[FrozenSet[str]]:
+    return None if bpy_struct.use_curve_mapping else _CURVE_MAPPING
 
 
-@conditional_properties.register(T.ColorManagedViewSettings)  # type: ignore[no-redef]
-def _(bpy_struct: T.Struct, properties: ItemsView) -> ItemsView:
-    if bpy_struct.use_curve_mapping:
-        return properties
-    filter_props = ["curve_mapping"]
-    return _filter_properties(properties, filter_props)
+def _object_filter(bpy_struct: T.Struct) -> Optional[FrozenSet[str]]:
+    return _INSTANCE_COLLECTION if bpy_struct.data else None
 
 
-@conditional_properties.register(T.Object)  # type: ignore[no-redef]
-def _(bpy_struct: T.Struct, properties: ItemsView) -> ItemsView:
-    if not bpy_struct.data:
-        return properties
+def _texspace_filter(bpy_struct: T.Struct) -> Optional[FrozenSet[str]]:
+    return _TEXSPACE if bpy_struct.use_auto_texspace else None
 
-    filter_props = ["instance_collection"]
-    return _filter_properties(properties, filter_props)
 
+def _node_filter(bpy_struct: T.Struct) -> Optional[FrozenSet[str]]:
+    # not hidden: saving width_hidden is ignored
+    return None if bpy_struct.hide else _WIDTH_HIDDEN
 
-@conditional_properties.register(T.Curve)  # type: ignore[no-redef]
-@conditional_properties.register(T.Mesh)  # type: ignore[no-redef]
-@conditional_properties.register(T.MetaBall)  # type: ignore[no-redef]
-def _(bpy_struct: T.Struct, properties: ItemsView) -> ItemsView:
-    if not bpy_struct.use_auto_texspace:
-        return properties
 
-    filter_props = ["texspace_location", "texspace_size"]
-    return _filter_properties(properties, filter_props)
+def _node_reroute_filter(bpy_struct: T.Struct) -> Optional[FrozenSet[str]]:
+    return None if bpy_struct.hide else _REROUTE_WIDTH_HIDDEN
 
 
-@conditional_properties.register(T.Node)  # type: ignore[no-redef]
-def _(bpy_struct: T.Struct, properties: ItemsView) -> ItemsView:
-    if bpy_struct.hide:
-        return properties
+def _node_group_io_filter(bpy_struct: T.Struct) -> Optional[FrozenSet[str]]:
+    # same as for Node
+    return _GROUP_IO if bpy_struct.hide else _GROUP_IO_WIDTH_HIDDEN
 
-    # not hidden: saving width_hidden is ignored
-    filter_props = ["width_hidden"]
 
-    if isinstance(bpy_struct, T.NodeReroute):
-        filter_props.extend(
-            [
-                # cannot be set !!
-                "width"
-            ]
-        )
+def _node_socket_filter(bpy_struct: T.Struct) -> Optional[FrozenSet[str]]:
+    # keep identifier for XxxNodeGroup only
+    return None if isinstance(bpy_struct.node, _node_groups) else _SOCKET_IDENTIFIERS
 
-    return _filter_properties(properties, filter_props)
 
+def _node_tree_filter(bpy_struct: T.Struct) -> Optional[FrozenSet[str]]:
+    return _NAME if bpy_struct.is_embedded_data else None
 
-@conditional_properties.register(T.NodeGroupInput)  # type: ignore[no-redef]
-@conditional_properties.register(T.NodeGroupOutput)  # type: ignore[no-redef]
-def _(bpy_struct: T.Struct, properties: ItemsView) -> ItemsView:
-    # For nodes of type NodeGroupInput and NodeGroupOutput, do not save inputs and outputs,
-    # which are created created/updated via NodeTree.inputs and NoteTree.outputs
-    filter_props = ["inputs", "outputs"]
-    if not bpy_struct.hide:
-        # same as for Node
-        filter_props.append("width_hidden")
 
-    filtered = {k: v for k, v in properties if k not in filter_props}
-    return filtered.items()
+def _layer_collection_filter(bpy_struct: T.Struct) -> Optional[FrozenSet[str]]:
+    return _EXCLUDE if bpy_struct.collection == bpy_struct.id_data.collection else None
 
 
-@conditional_properties.register(T.NodeSocket)  # type: ignore[no-redef]
-def _(bpy_struct: T.Struct, properties: ItemsView) -> ItemsView:
-    # keep identifier for XxxNodeGroup only
-    if isinstance(bpy_struct.node, _node_groups):
-        return properties
+def _unit_settings_filter(bpy_struct: T.Struct) -> Optional[FrozenSet[str]]:
+    return _UNITS if bpy_struct.system == "NONE" else None
 
-    filter_props = [
-        "identifier",
-        # saving bl_idname for NodeReroute (and others ?) cause havoc
-        "bl_idname",
-    ]
 
-    return _filter_properties(properties, filter_props)
+def _fcurve_filter(bpy_struct: T.Struct) -> Optional[FrozenSet[str]]:
+    return _GROUP if bpy_struct.group is None else None
 
 
-@conditional_properties.register(T.NodeTree)  # type: ignore[no-redef]
-def _(bpy_struct: T.Struct, properties: ItemsView) -> ItemsView:
-    if not bpy_struct.is_embedded_data:
-        return properties
+def _sequence_filter(bpy_struct: T.Struct) -> Optional[FrozenSet[str]]:
+    if bpy_struct.use_crop:
+        return None if bpy_struct.use_translation else _TRANSFORM
+    return _CROP if bpy_struct.use_translation else _CROP_TRANSFORM
 
-    filter_props = ["name"]
-    return _filter_properties(properties, filter_props)
 
+# Maps a type to a function that returns the names of the properties to filter out, or None if the properties
+# must not be filtered. The most derived type wins.
+_conditional_filters: Dict[type, Callable[[T.Struct], Optional[FrozenSet[str]]]] = {
+    T.ColorManagedViewSettings: _color_managed_view_settings_filter,
+    T.Object: _object_filter,
+    T.Curve: _texspace_filter,
+    T.Mesh: _texspace_filter,
+    T.MetaBall: _texspace_filter,
+    T.Node: _node_filter,
+    T.NodeReroute: _node_reroute_filter,
+    T.NodeGroupInput: _node_group_io_filter,
+    T.NodeGroupOutput: _node_group_io_filter,
+    T.NodeSocket: _node_socket_filter,
+    T.NodeTree: _node_tree_filter,
+    T.LayerCollection: _layer_collection_filter,
+    T.UnitSettings: _unit_settings_filter,
+    T.FCurve: _fcurve_filter,
+}
+if bpy.app.version is not None and bpy.app.version < (2, 92, 0):
+    for _sequence_type in (
+        T.EffectSequence,
+        T.ImageSequence,
+        T.MaskSequence,
+        T.MetaSequence,
+        T.MovieClipSequence,
+        T.MovieSequence,
+        T.SceneSequence,
+    ):
+        _conditional_filters[_sequence_type] = _sequence_filter
+
+# Resolution of type(bpy_struct) into a _conditional_filters entry, filled on first use of each concrete type,
+# since most of the visited structs (e.g. ShaderNodeXxx) are subclasses of the registered types
+_resolved_conditional_filters: Dict[type, Optional[Callable[[T.Struct], Optional[FrozenSet[str]]]]] = {}
+
+
+def _resolve_by_mro(registry: Dict[type, Any], class_: type) -> Any:
+    """Returns the registry entry for the most derived class in the MRO of class_, or None"""
+    # ignore "object" parent
+    for cls_ in class_.mro()[:-1]:
+        value = registry.get(cls_)
+        if value is not None:
+            return value
+    return None
 
-@conditional_properties.register(T.LayerCollection)  # type: ignore[no-redef]
-def _(bpy_struct: T.Struct, properties: ItemsView) -> ItemsView:
-    scene = bpy_struct.id_data
-    if bpy_struct.collection != scene.collection:
-        return properties
 
-    filter_props = ["exclude"]
-    return _filter_properties(properties, filter_props)
+def conditional_properties(bpy_struct: T.Struct, properties: ItemsView) -> Iterable[Tuple[str, T.Property]]:
+    """Filter properties list according to a specific property value in the same structure.
 
+    This prevents loading values that cannot always be saved, such as Object.instance_collection
+    that can only be saved when Object.data is None
 
-@conditional_properties.register(T.UnitSettings)  # type: ignore[no-redef]
-def _(bpy_struct: T.Struct, properties: ItemsView) -> ItemsView:
-    if bpy_struct.system != "NONE":
+    Args:
+        bpy_struct: the structure
+        properties: a view into a Dict[str, bpy.types.Property] to filter
+    Returns:
+        The filtered properties
+    """
+    class_ = type(bpy_struct)
+    try:
+        filter_func = _resolved_conditional_filters[class_]
+    except KeyError:
+        filter_func = _resolve_by_mro(_conditional_filters, class_)
+        _resolved_conditional_filters[class_] = filter_func
+
+    if filter_func is None:
         return properties
 
-    filter_props = ["length_unit", "mass_unit", "time_unit", "temperature_unit"]
-    return _filter_properties(properties, filter_props)
+    exclude_names = filter_func(bpy_struct)
+    if exclude_names is None:
+        return properties
 
+    return _filter_properties(properties, exclude_names)
 
-@conditional_properties.register(T.FCurve)  # type: ignore[no-redef]
-def _(bpy_struct: T.Struct, properties: ItemsView) -> ItemsView:
-    if bpy_struct.group is not None:
-        return properties
 
-    # FCurve.group = None
-    # triggers noisy message
-    # ERROR: one of the ID's for the groups to assign to is invalid (ptr=0000028B55B0C038, val=0000000000000000)
-    filter_props = ["group"]
-    return _filter_properties(properties, filter_props)
-
-
-@conditional_properties.register(T.EffectSequence)  # type: ignore[no-redef]
-@conditional_properties.register(T.ImageSequence)
-@conditional_properties.register(T.MaskSequence)
-@conditional_properties.register(T.MetaSequence)
-@conditional_properties.register(T.MovieClipSequence)
-@conditional_properties.register(T.MovieSequence)
-@conditional_properties.register(T.SceneSequence)
-def _(bpy_struct: T.Struct, properties: ItemsView) -> ItemsView:
-    if bpy.app.version >= (2, 92, 0):
-        return properties
-    filter_props = []
-    if not bpy_struct.use_crop:
-        filter_props.append("crop")
-    if not bpy_struct.use_translation:
-        filter_props.append("transform")
+def _pre_save_mesh(proxy: DatablockProxy, target: T.ID, context: Context) -> T.ID:
+    from mixer.blender_data.mesh_proxy import MeshProxy
 
-    if not filter_props:
-        return properties
+    assert isinstance(proxy, MeshProxy)
+    if proxy.requires_clear_geometry(target):
+        target.clear_geometry()
+    return target
 
-    return _filter_properties(properties, filter_props)
 
+def _pre_save_material(proxy: DatablockProxy, target: T.ID, context: Context) -> T.ID:
+    is_grease_pencil = proxy.data("is_grease_pencil")
+    # will be None for a DeltaUpdate that does not modify "is_grease_pencil"
+    if is_grease_pencil is not None:
+        # Seems to be write once as no depsgraph update is fired
+        if is_grease_pencil and not target.grease_pencil:
+            bpy.data.materials.create_gpencil_data(target)
+        elif not is_grease_pencil and target.grease_pencil:
+            bpy.data.materials.remove_gpencil_data(target)
+    return target
+
+
+def _pre_save_scene(proxy: DatablockProxy, target: T.ID, context: Context) -> T.ID:
+    from mixer.blender_data.misc_proxies import NonePtrProxy
 
-_morphable_types = (T.Light, T.Texture)
-"""Datablock types that may change and need type_recast type after modification of their type attribute."""
+    sequence_editor = proxy.data("sequence_editor")
+    if sequence_editor is not None:
+        # NonePtrProxy or StructProxy
+        if not isinstance(sequence_editor, NonePtrProxy) and target.sequence_editor is None:
+            target.sequence_editor_create()
+        elif isinstance(sequence_editor, NonePtrProxy) and target.sequence_editor is not None:
+            target.sequence_editor_clear()
+    return target
+
+
+def _pre_save_morphable(proxy: DatablockProxy, target: T.ID, context: Context) -> T.ID:
+    # required first to have access to new datablock attributes
+    type_ = proxy.data("type")
+    if type_ is not None and type_ != target.type:
+        target.type = type_
+        # must reload the reference
+        target = target.type_recast()
+        uuid = proxy.mixer_uuid
+        context.proxy_state.remove_datablock(uuid)
+        context.proxy_state.add_datablock(uuid, target)
+    return target
+
+
+def _pre_save_action(proxy: DatablockProxy, target: T.ID, context: Context) -> T.ID:
+    groups = proxy.data("groups")
+    if groups:
+        groups.save(target.groups, target, "groups", context)
+    return target
+
+
+_pre_save_functions: Dict[type, Callable[[DatablockProxy, T.ID, Context], T.ID]] = {
+    T.Mesh: _pre_save_mesh,
+    T.Material: _pre_save_material,
+    T.Scene: _pre_save_scene,
+    # Datablock types that may change and need type_recast type after modification of their type attribute.
+    T.Light: _pre_save_morphable,
+    T.Texture: _pre_save_morphable,
+    T.Action: _pre_save_action,
+}
+_resolved_pre_save_functions: Dict[type, Optional[Callable[[DatablockProxy, T.ID, Context], T.ID]]] = {}
 
 
 def pre_save_datablock(proxy: DatablockProxy, target: T.ID, context: Context) -> T.ID:
@@ -518,47 +592,17 @@ def pre_save_datablock(proxy: DatablockProxy, target: T.ID, context: Context) ->
 
     #  animation_data is handled in StructProxy (parent class of DatablockProxy)
 
-    if isinstance(target, T.Mesh):
-        from mixer.blender_data.mesh_proxy import MeshProxy
-
-        assert isinstance(proxy, MeshProxy)
-        if proxy.requires_clear_geometry(target):
-            target.clear_geometry()
-    elif isinstance(target, T.Material):
-        is_grease_pencil = proxy.data("is_grease_pencil")
-        # will be None for a DeltaUpdate that does not modify "is_grease_pencil"
-        if is_grease_pencil is not None:
-            # Seems to be write once as no depsgraph update is fired
-            if is_grease_pencil and not target.grease_pencil:
-                bpy.data.materials.create_gpencil_data(target)
-            elif not is_grease_pencil and target.grease_pencil:
-                bpy.data.materials.remove_gpencil_data(target)
-    elif isinstance(target, T.Scene):
-        from mixer.blender_data.misc_proxies import NonePtrProxy
-
-        sequence_editor = proxy.data("sequence_editor")
-        if sequence_editor is not None:
-            # NonePtrProxy or StructProxy
-            if not isinstance(sequence_editor, NonePtrProxy) and target.sequence_editor is None:
-                target.sequence_editor_create()
-            elif isinstance(sequence_editor, NonePtrProxy) and target.sequence_editor is not None:
-                target.sequence_editor_clear()
-    elif isinstance(target, _morphable_types):
-        # required first to have access to new datablock attributes
-        type_ = proxy.data("type")
-        if type_ is not None and type_ != target.type:
-            target.type = type_
-            # must reload the reference
-            target = target.type_recast()
-            uuid = proxy.mixer_uuid
-            context.proxy_state.remove_datablock(uuid)
-            context.proxy_state.add_datablock(uuid, target)
-    elif isinstance(target, T.Action):
-        groups = proxy.data("groups")
-        if groups:
-            groups.save(target.groups, target, "groups", context)
+    class_ = type(target)
+    try:
+        pre_save = _resolved_pre_save_functions[class_]
+    except KeyError:
+        # e.g. PointLight for Light
+        pre_save = _resolve_by_mro(_pre_save_functions, class_)
+        _resolved_pre_save_functions[class_] = pre_save
 
-    return target
+    if pre_save is None:
+        return target
+    return pre_save(proxy, target, context)
 
 
 #
@@ -568,46 +612,71 @@ def pre_save_datablock(proxy: DatablockProxy, target: T.ID, context: Context) ->
 def add_element(collection: T.bpy_prop_collection, proxy: Proxy, index: int, context: Context):
     """Add an element to a bpy_prop_collection using the collection specific API.s"""
 
-    if hasattr(collection, "add"):
+    # dispatch_rna calls this implementation when bl_rna is missing or None
+    add = getattr(collection, "add", None)
+    if add is not None:
         # either a bpy_prop_collection  with an rna or a bpy_prop_collection_idprop
         try:
-            collection.add()
+            add()
             return
         except Exception as e:
             logger.error(f"add_element: call to add() failed for {context.visit_state.display_path()} ...")
             logger.error(f"... {e!r}")
             raise AddElementFailed from None
 
-    if not hasattr(collection, "bl_rna"):
-        # a bpy.types.bpy_prop_collection, e.g Pose.bones
-        # We should not even attempt to add elements in these collections since they do not allow it at all.
-        # However bpy_prop_collection and collections with an rna both managed by StructCollectionProxy. We need
-        # proxy update to update the contents of existing elements, but it should not attempt to add/remove elements.
-        # As a consequence, for attributes that fall into this category we trigger updates with additions and
-        # deletions that are meaningless. Ignore them.
-        # The right design could be to have different proxies for bpy_prop_collection and bpy_struct that behave like
-        # collections.
-        # see Proxy construction in  read_attribute()
-        return
+    # a bpy.types.bpy_prop_collection, e.g Pose.bones
+    # We should not even attempt to add elements in these collections since they do not allow it at all.
+    # However bpy_prop_collection and collections with an rna both managed by StructCollectionProxy. We need
+    # proxy update to update the contents of existing elements, but it should not attempt to add/remove elements.
+    # As a consequence, for attributes that fall into this category we trigger updates with additions and
+    # deletions that are meaningless. Ignore them.
+    # The right design could be to have different proxies for bpy_prop_collection and bpy_struct that behave like
+    # collections.
+    # see Proxy construction in  read_attribute()
+    return
+
+
+_add_element_default_signatures: Dict[type, Tuple[str, bool]] = {}
+"""Collection rna type : (name of the method that creates an element, whether it takes the element name).
+
+Filled when _add_element_default first succeeds for a collection type, to skip the probing afterwards"""
 
 
 @add_element.register_default()
 def _add_element_default(collection: T.bpy_prop_collection, proxy: Proxy, index: int, context: Context) -> T.bpy_struct:
+    rna_type = type(collection.bl_rna)
+    signature = _add_element_default_signatures.get(rna_type)
+    if signature is not None:
+        method_name, with_name = signature
+        try:
+            new_or_add = getattr(collection, method_name)
+            return new_or_add(proxy.data("name")) if with_name else new_or_add()
+        except Exception as e:
+            logger.error(f"add_element: call to {method_name}() failed for {context.visit_state.display_path()} ...")
+            logger.error(f"... {e!r}")
+            raise AddElementFailed from None
+
     try:
         new_or_add = collection.new
+        method_name = "new"
     except AttributeError:
         try:
             new_or_add = collection.add
+            method_name = "add"
         except AttributeError:
             logger.error(f"add_element: not implemented for {context.visit_state.display_path()} ...")
             raise AddElementFailed from None
 
     try:
-        return new_or_add()
+        element = new_or_add()
+        _add_element_default_signatures[rna_type] = (method_name, False)
+        return element
     except TypeError:
         try:
             key = proxy.data("name")
-            return new_or_add(key)
+            element = new_or_add(key)
+            _add_element_default_signatures[rna_type] = (method_name, True)
+            return element
         except Exception as e:
             logger.error(f"add_element: not implemented for {context.visit_state.display_path()} ...")
             logger.error(f"... {e!r}")
@@ -724,15 +793,16 @@ def _(collection: T.bpy_prop_collection, proxy: Proxy, index: int, context: Cont
     # TODO current implementation fails
     # All keying sets paths have an empty name, and insertion with add() fails
     # with an empty name
-    target_ref = proxy.data("id")
+    data = proxy.data
+    target_ref = data("id")
     if target_ref is None:
         target = None
     else:
         target = target_ref.target(context)
-    data_path = proxy.data("data_path")
-    index = proxy.data("array_index")
-    group_method = proxy.data("group_method")
-    group_name = proxy.data("group")
+    data_path = data("data_path")
+    index = data("array_index")
+    group_method = data("group_method")
+    group_name = data("group")
     return collection.add(
         target_id=target, data_path=data_path, index=index, group_method=group_method, group_name=group_name
     )
@@ -753,9 +823,10 @@ def _(collection: T.bpy_prop_collection, proxy: Proxy, index: int, context: Cont
 
 @add_element.register(T.AttributeGroup)  # type: ignore[no-redef]
 def _(collection: T.bpy_prop_collection, proxy: Proxy, index: int, context: Context) -> T.bpy_struct:
-    name = proxy.data("name")
-    type_ = proxy.data("type")
-    domain = proxy.data("domain")
+    data = proxy.data
+    name = data("name")
+    type_ = data("type")
+    domain = data("domain")
     return collection.new(name, type_, domain)
 
 
@@ -781,35 +852,64 @@ else:
     _Sequences = T.SequencesTopLevel
 
 
+def _new_effect_sequence(
+    collection: T.bpy_prop_collection, proxy: Proxy, context: Context, type_name: str, name: str, channel, frame_start
+) -> Optional[T.Sequence]:
+    # overwritten anyway
+    frame_end = frame_start + 1
+    return collection.new_effect(name, type_name, channel, frame_start, frame_end=frame_end)
+
+
+def _new_sound_sequence(
+    collection: T.bpy_prop_collection, proxy: Proxy, context: Context, type_name: str, name: str, channel, frame_start
+) -> Optional[T.Sequence]:
+    sound = proxy.data("sound")
+    target = sound.target(context)
+    if not target:
+        logger.warning(f"missing target ID block for bpy.data.{sound.collection}[{sound.key}] ")
+        return None
+    filepath = target.filepath
+    return collection.new_sound(name, filepath, channel, frame_start)
+
+
+def _new_movie_sequence(
+    collection: T.bpy_prop_collection, proxy: Proxy, context: Context, type_name: str, name: str, channel, frame_start
+) -> Optional[T.Sequence]:
+    filepath = proxy.data("filepath")
+    return collection.new_movie(name, filepath, channel, frame_start)
+
+
+def _new_image_sequence(
+    collection: T.bpy_prop_collection, proxy: Proxy, context: Context, type_name: str, name: str, channel, frame_start
+) -> Optional[T.Sequence]:
+    directory = proxy.data("directory")
+    filename = proxy.data("elements").data(0).data("filename")
+    filepath = str(Path(directory) / filename)
+    return collection.new_image(name, filepath, channel, frame_start)
+
+
+@lru_cache(None)
+def _sequence_factories() -> Dict[str, Callable[..., Optional[T.Sequence]]]:
+    """Sequence type name : function that creates a sequence of this type"""
+    factories: Dict[str, Callable[..., Optional[T.Sequence]]] = {
+        "SOUND": _new_sound_sequence,
+        "MOVIE": _new_movie_sequence,
+        "IMAGE": _new_image_sequence,
+    }
+    factories.update((type_name, _new_effect_sequence) for type_name in _effect_sequences())
+    return factories
+
+
 @add_element.register(_Sequences)  # type: ignore[no-redef]
 def _(collection: T.bpy_prop_collection, proxy: Proxy, index: int, context: Context) -> T.bpy_struct:
-    type_name = proxy.data("type")
-    name = proxy.data("name")
-    channel = proxy.data("channel")
-    frame_start = proxy.data("frame_start")
-    if type_name in _effect_sequences():
-        # overwritten anyway
-        frame_end = frame_start + 1
-        return collection.new_effect(name, type_name, channel, frame_start, frame_end=frame_end)
-    if type_name == "SOUND":
-        sound = proxy.data("sound")
-        target = sound.target(context)
-        if not target:
-            logger.warning(f"missing target ID block for bpy.data.{sound.collection}[{sound.key}] ")
-            return None
-        filepath = target.filepath
-        return collection.new_sound(name, filepath, channel, frame_start)
-    if type_name == "MOVIE":
-        filepath = proxy.data("filepath")
-        return collection.new_movie(name, filepath, channel, frame_start)
-    if type_name == "IMAGE":
-        directory = proxy.data("directory")
-        filename = proxy.data("elements").data(0).data("filename")
-        filepath = str(Path(directory) / filename)
-        return collection.new_image(name, filepath, channel, frame_start)
-
-    logger.warning(f"Sequence type not implemented: {type_name}")
-    return None
+    data = proxy.data
+    type_name = data("type")
+    factory = _sequence_factories().get(type_name)
+    if factory is None:
+        logger.warning(f"Sequence type not implemented: {type_name}")
+        return None
+
+    return factory(collection, proxy, context, type_name, data("name"), data("channel"), data("frame_start"))
 
 
 @add_element.register(T.IDMaterials)  # type: ignore[no-redef]
@@ -845,19 +945,21 @@ def fit_aos(target: T.bpy_prop_collection, proxy: AosProxy, context: Context):
             target.add(incoming_length)
         return
 
-    if isinstance(target_rna, type(T.GPencilStrokePoints.bl_rna)):
+    if isinstance(target_rna, _gpencil_stroke_points_type):
         existing_length = len(target)
         incoming_length = proxy.length
         delta = incoming_length - existing_length
         if delta > 0:
             target.add(delta)
-        else:
-            while delta < 0:
-                target.pop()
-                delta += 1
+        elif delta < 0:
+            # GPencilStrokePoints has no clear() nor ranged removal. pop() from the end does not move the remaining
+            # points
+            pop = target.pop
+            for _ in range(-delta):
+                pop()
         return
 
-    if isinstance(target_rna, type(T.SplineBezierPoints.bl_rna)):
+    if isinstance(target_rna, _spline_bezier_points_type):
         existing_length = len(target)
         incoming_length = len(proxy)
         delta = incoming_length - existing_length
@@ -924,13 +1026,14 @@ def diff_must_replace(
 
         # As diff yields a complete DiffReplace or nothing, all the attributes are present in the proxy
         for bl_item, proxy in zip(collection, sequence):
+            data = proxy.data
             bl_material = bl_item.material
-            material_proxy: Union[DatablockRefProxy, NonePtrProxy] = proxy.data("material")
+            material_proxy: Union[DatablockRefProxy, NonePtrProxy] = data("material")
             if (bl_material is None) != isinstance(material_proxy, NonePtrProxy):
                 return True
             if bl_material is not None and bl_material.mixer_uuid != material_proxy.mixer_uuid:
                 return True
-            if bl_item.link != proxy.data("link"):
+            if bl_item.link != data("link"):
                 return True
 
     elif collection_property == _key_blocks_property():
@@ -960,11 +1063,12 @@ def _(collection: T.bpy_prop_collection, sequence: List[DatablockProxy], collect
 @diff_must_replace.register(T.VertexGroups)  # type: ignore[no-redef]
 def _(collection: T.bpy_prop_collection, sequence: List[DatablockProxy], collection_property: T.Property) -> bool:
     # Full replace if anything has changed is easier to cope with in ObjectProxy._update_vertex_groups()
-    return (
-        any((bl_item.name != proxy.data("name") for bl_item, proxy in zip(collection, sequence)))
-        or any((bl_item.index != proxy.data("index") for bl_item, proxy in zip(collection, sequence)))
-        or any((bl_item.lock_weight != proxy.data("lock_weight") for bl_item, proxy in zip(collection, sequence)))
-    )
+    # Single pass, that stops at the first mismatch
+    for bl_item, proxy in zip(collection, sequence):
+        data = proxy.data
+        if bl_item.name != data("name") or bl_item.index != data("index") or bl_item.lock_weight != data("lock_weight"):
+            return True
+    return False
 
 
 @diff_must_replace.register(T.GreasePencilLayers)  # type: ignore[no-redef]
@@ -1065,7 +1169,9 @@ def truncate_collection(collection: T.bpy_prop_collection, size: int):
 @truncate_collection.register_default()
 def _truncate_collection_remove(collection: T.bpy_prop_collection, size: int):
     try:
-        while len(collection) > max(size, 0):
+        # compute len() once, but fetch the last item again after each removal: remove() may reallocate the
+        # elements (e.g. CurveMapPoints), which invalidates references to the items obtained before
+        for _ in range(len(collection) - max(size, 0)):
             collection.remove(collection[-1])
     except Exception as e:
         logger.error(f"truncate_collection {collection}: exception ...")
@@ -1074,7 +1180,7 @@ def _truncate_collection_remove(collection: T.bpy_prop_collection, size: int):
 
 @truncate_collection.register(T.IDMaterials)
 def _truncate_collection_pop(collection: T.bpy_prop_collection, size: int):
-    while len(collection) > max(size, 0):
+    for _ in range(len(collection) - max(size, 0)):
         collection.pop()
 
 
@@ -24,7 +24,7 @@ from bpy import data as D  # noqa
 from bpy import types as T  # noqa
 
 from mixer.blender_data.aos_soa_proxy import SoaElement
-from mixer.blender_data.bpy_data_proxy import BpyDataProxy
+from mixer.blender_data.bpy_data_proxy import BpyDataProxy, ProxyState
 from mixer.blender_data.datablock_ref_proxy import DatablockRefProxy
 from mixer.blender_data.misc_proxies import NonePtrProxy
 from mixer.blender_data.filter import (
@@ -224,3 +224,71 @@ class TestFunctionDispatch(unittest.TestCase):
         self.assertEqual(g(self.cube.name, 4), ("g_no_rna", 4))
         self.assertEqual(g(self.cube.material_slots, 5), ("g_no_rna", 5))
         self.assertEqual(g(self.cube.particle_systems, 6), ("g_no_rna", 6))
+
+
+class TestProxyStateUsers(unittest.TestCase):
+    # test_misc.TestProxyStateUsers
+    def setUp(self):
+        self.state = ProxyState()
+
+    def test_single_user(self):
+        state = self.state
+        state._add_user("mesh", "object_a")
+        self.assertEqual(state.objects["mesh"], "object_a")
+        self.assertEqual(set(state.object_uuids("mesh")), {"object_a"})
+
+    def test_duplicate_user(self):
+        state = self.state
+        state._add_user("mesh", "object_a")
+        state._add_user("mesh", "object_a")
+        self.assertEqual(state.objects["mesh"], "object_a")
+
+        state._add_user("mesh", "object_b")
+        state._add_user("mesh", "object_b")
+        self.assertEqual(state.objects["mesh"], {"object_a", "object_b"})
+        self.assertEqual(set(state.object_uuids("mesh")), {"object_a", "object_b"})
+
+    def test_remove_to_none(self):
+        state = self.state
+        state._add_user("mesh", "object_a")
+        state._add_user("mesh", "object_b")
+        state._add_user("mesh", "object_c")
+        self.assertEqual(set(state.object_uuids("mesh")), {"object_a", "object_b", "object_c"})
+
+        state._remove_user("mesh", "object_c")
+        self.assertEqual(state.objects["mesh"], {"object_a", "object_b"})
+
+        # down to one user, back to a single uuid
+        state._remove_user("mesh", "object_a")
+        self.assertEqual(state.objects["mesh"], "object_b")
+        self.assertEqual(set(state.object_uuids("mesh")), {"object_b"})
+
+        state._remove_user("mesh", "object_b")
+        self.assertNotIn("mesh", state.objects)
+        self.assertEqual(set(state.object_uuids("mesh")), set())
+
+    def test_remove_unknown(self):
+        state = self.state
+
+        # unknown data
+        state._remove_user("mesh", "object_a")
+        self.assertNotIn("mesh", state.objects)
+
+        # unknown user of single user data
+        state._add_user("mesh", "object_a")
+        state._remove_user("mesh", "object_b")
+        self.assertEqual(state.objects["mesh"], "object_a")
+
+        # unknown user of multiple user data
+        state._add_user("mesh", "object_b")
+        state._remove_user("mesh", "object_c")
+        self.assertEqual(state.objects["mesh"], {"object_a", "object_b"})
+
+    def test_independent_data(self):
+        state = self.state
+        state._add_user("mesh", "object_a")
+        state._add_user("light", "object_b")
+        state._add_user("light", "object_c")
+        self.assertEqual(set(state.object_uuids("mesh")), {"object_a"})
+        self.assertEqual(set(state.object_uuids("light")), {"object_b", "object_c"})
+        self.assertEqual(set(state.object_uuids("camera")), set())
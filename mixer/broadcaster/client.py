@@ -32,6 +32,10 @@ from mixer.broadcaster.common import update_attributes_and_get_diff, update_name
 
 logger = logging.getLogger() if __name__ == "__main__" else logging.getLogger(__name__)
 
+# fetch_outgoing_commands() writes the serialized commands once the buffer reaches this size, so that a large
+# batch (e.g. the initial room content) is not copied into a single buffer
+_flush_size = 2 * 1024 * 1024
+
 
 class Client:
     """
@@ -106,6 +110,9 @@ class Client:
     def add_command(self, command: common.Command):
         self.pending_commands.append(command)
 
+    def add_commands(self, commands: List[common.Command]):
+        self.pending_commands.extend(commands)
+
     def handle_connection_lost(self):
         logger.info("Connection lost for %s:%s", self.host, self.port)
         # Set socket to None before putting CONNECTION_LIST message to avoid sending/reading new messages
@@ -269,7 +276,28 @@ class Client:
     def fetch_outgoing_commands(self, commands_send_interval=0):
         """
         Send commands in pending_commands queue to the server.
+
+        Unless commands_send_interval is set, the pending commands are serialized into a buffer that is written
+        each time it exceeds _flush_size, and once at the end.
         """
+        if commands_send_interval <= 0:
+            if self.pending_commands:
+                logger.debug("Send %d commands", len(self.pending_commands))
+                pending_commands = self.pending_commands
+                self.pending_commands = []
+                buffer = bytearray()
+                try:
+                    for command in pending_commands:
+                        command.write_to(buffer)
+                        if len(buffer) >= _flush_size:
+                            common.write_buffer(self.socket, buffer)
+                            buffer.clear()
+                    if buffer:
+                        common.write_buffer(self.socket, buffer)
+                except common.ClientDisconnectedException:
+                    self.handle_connection_lost()
+            return
+
         for idx, command in enumerate(self.pending_commands):
             logger.debug("Send %s (%d / %d)", command.type, idx + 1, len(self.pending_commands))
 
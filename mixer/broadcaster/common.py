@@ -239,6 +239,12 @@ class ClientDisconnectedException(Exception):
     """When a client is disconnected and we try to read from it."""
 
 
+_uint32 = struct.Struct("<I")
+_pack_uint32 = _uint32.pack
+_unpack_uint32_from = _uint32.unpack_from
+_vector3 = struct.Struct("3f")
+
+
 def int_to_bytes(value, size=8):
     return value.to_bytes(size, byteorder="little")
 
@@ -251,15 +257,19 @@ def int_to_message_type(value):
     return MessageType(value)
 
 
+_encoded_true = int_to_bytes(1, 4)
+_encoded_false = int_to_bytes(0, 4)
+
+
 def encode_bool(value):
     if value:
-        return int_to_bytes(1, 4)
+        return _encoded_true
     else:
-        return int_to_bytes(0, 4)
+        return _encoded_false
 
 
 def decode_bool(data, index):
-    value = bytes_to_int(data[index : index + 4])
+    (value,) = _unpack_uint32_from(data, index)
     if value == 1:
         return True, index + 4
     else:
@@ -268,7 +278,7 @@ def decode_bool(data, index):
 
 def encode_string(value):
     encoded_value = value.encode()
-    return int_to_bytes(len(encoded_value), 4) + encoded_value
+    return _pack_uint32(len(encoded_value)) + encoded_value
 
 
 def decode_string(data, index):
@@ -279,6 +289,21 @@ def decode_string(data, index):
     return value, end
 
 
+def decode_string_pair(data, index=0):
+    """
+    Decode two consecutive strings encoded with encode_string().
+    """
+    (length,) = _unpack_uint32_from(data, index)
+    start = index + 4
+    end = start + length
+    first = data[start:end].decode()
+    (length,) = _unpack_uint32_from(data, end)
+    start = end + 4
+    end = start + length
+    second = data[start:end].decode()
+    return first, second, end
+
+
 def encode_json(value: dict):
     return encode_string(json.dumps(value))
 
@@ -313,11 +338,11 @@ def decode_vector2(data, index):
 
 
 def encode_vector3(value):
-    return struct.pack("3f", *(value.x, value.y, value.z))
+    return _vector3.pack(value.x, value.y, value.z)
 
 
 def decode_vector3(data, index):
-    return struct.unpack("3f", data[index : index + 3 * 4]), index + 3 * 4
+    return _vector3.unpack_from(data, index), index + 3 * 4
 
 
 def encode_vector4(value):
@@ -450,6 +475,9 @@ def decode_py_array(buffer: bytes, index: int) -> Tuple[array.array, int]:
     return array_, index + byte_count
 
 
+_command_header = struct.Struct("<QIH")
+
+
 class Command:
     _id = 100
 
@@ -471,6 +499,14 @@ class Command:
 
         return size + command_id + mtype + self.data
 
+    def write_to(self, buffer: bytearray):
+        """
+        Append the byte representation of this command to buffer, avoiding the intermediate bytes objects
+        of to_byte_buffer()
+        """
+        buffer += _command_header.pack(len(self.data), self.id, self.type.value)
+        buffer += self.data
+
 
 class CommandFormatter:
     def format_clients(self, clients):
@@ -582,7 +618,17 @@ def write_message(sock: Optional[Socket], command: Command):
         logger.warning("write_message called with no socket")
         return
 
-    buffer = command.to_byte_buffer()
+    write_buffer(sock, command.to_byte_buffer())
+
+
+def write_buffer(sock: Optional[Socket], buffer):
+    """
+    Write buffer, that contains one or more commands, to the socket.
+    Raise ClientDisconnectedException if the socket is disconnected.
+    """
+    if not sock:
+        logger.warning("write_buffer called with no socket")
+        return
 
     try:
         _, w, _ = select.select([], [sock._socket], [])
@@ -45,7 +45,7 @@ def set_client_attributes():
     username = prefs.user
     usercolor = prefs.color
     share_data.client.set_client_attributes(
-        {ClientAttributes.USERNAME: username, ClientAttributes.USERCOLOR: list(usercolor)}
+        {ClientAttributes.USERNAME: username, ClientAttributes.USERCOLOR: usercolor[:]}
     )
 
 
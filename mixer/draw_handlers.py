@@ -160,12 +160,14 @@ def users_frustum_name_draw():
     ):
         return
 
+    display_ids = prefs.display_ids_gizmos
+
     def per_user_callback(user_dict):
         user_name = user_dict.get(ClientAttributes.USERNAME, None)
         return user_name is not None
 
     def per_frustum_callback(user_dict, frustum):
-        draw_user_name(user_dict, frustum[0])
+        draw_user_name(user_dict, frustum[0], display_ids)
 
     users_frustrum_draw_iteration(per_user_callback, per_frustum_callback)
 
@@ -174,7 +176,8 @@ def users_frustrum_draw_iteration(per_user_callback, per_frustum_callback):
     if share_data.client is None:
         return
 
-    prefs = get_mixer_prefs()
+    # read the preference once, not once per user
+    display_own_gizmos = get_mixer_prefs().display_own_gizmos
 
     for user_dict in share_data.client.clients_attributes.values():
         scenes = user_dict.get(ClientAttributes.USERSCENES, None)
@@ -184,7 +187,7 @@ def users_frustrum_draw_iteration(per_user_callback, per_frustum_callback):
         user_id = user_dict[ClientAttributes.ID]
         user_room = user_dict[ClientAttributes.ROOM]
         if (
-            not prefs.display_own_gizmos and share_data.client.client_id == user_id
+            not display_own_gizmos and share_data.client.client_id == user_id
         ) or share_data.client.current_room != user_room:
             continue  # don't draw my own frustums or frustums from users outside my room
 
@@ -255,13 +258,15 @@ def users_selection_name_draw():
     ):
         return
 
+    display_ids = prefs.display_ids_gizmos
+
     def per_user_callback(user_dict):
         user_name = user_dict.get(ClientAttributes.USERNAME, None)
         return user_name is not None
 
     def per_object_callback(user_dict, object, matrix, local_bbox):
         bbox_corner = matrix @ Vector(local_bbox[1])
-        draw_user_name(user_dict, bbox_corner)
+        draw_user_name(user_dict, bbox_corner, display_ids)
 
     users_selection_draw_iteration(
         per_user_callback, per_object_callback, collection_detail=False, draw_first_only=True
@@ -274,7 +279,8 @@ def users_selection_draw_iteration(
     if share_data.client is None:
         return
 
-    prefs = get_mixer_prefs()
+    # read the preference once, not once per user
+    display_own_gizmos = get_mixer_prefs().display_own_gizmos
 
     for user_dict in share_data.client.clients_attributes.values():
         scenes = user_dict.get(ClientAttributes.USERSCENES, None)
@@ -284,7 +290,7 @@ def users_selection_draw_iteration(
         user_id = user_dict[ClientAttributes.ID]
         user_room = user_dict[ClientAttributes.ROOM]
         if (
-            not prefs.display_own_gizmos and share_data.client.client_id == user_id
+            not display_own_gizmos and share_data.client.client_id == user_id
         ) or share_data.client.current_room != user_room:
             continue  # don't draw my own selection or selection from users outside my room
 
@@ -327,9 +333,7 @@ def users_selection_draw_iteration(
                     return
 
 
-def draw_user_name(user_dict, coord_3d):
-    prefs = get_mixer_prefs()
-
+def draw_user_name(user_dict, coord_3d, display_ids: bool):
     import blf
     from bpy_extras import view3d_utils
 
@@ -342,7 +346,7 @@ def draw_user_name(user_dict, coord_3d):
     blf.color(0, user_color[0], user_color[1], user_color[2], 1.0)
 
     text = user_dict.get(ClientAttributes.USERNAME, None)
-    if prefs.display_ids_gizmos:
+    if display_ids:
         text += f" ({user_dict[ClientAttributes.ID]})"
 
     blf.draw(0, text)
@@ -33,6 +33,7 @@ import logging
 import bpy
 
 from mixer.share_data import share_data, get_object_constraints
+from mixer.broadcaster.common import Command
 from mixer import handlers_generic as generic
 from mixer.blender_client import collection as collection_api
 from mixer.blender_client import object_ as object_api
@@ -40,7 +41,7 @@ from mixer.blender_client import scene as scene_api
 from mixer.blender_client import constraint as constraint_api
 import mixer.shot_manager as shot_manager
 import itertools
-from typing import Mapping, Any
+from typing import Mapping, Any, List
 from uuid import uuid4
 
 if bpy.app.handlers.persistent is not None:
@@ -450,12 +451,14 @@ def remove_objects_from_collections():
     """
     Non master collections, actually
     """
-    changed = False
+    commands: List[Command] = []
     for collection_name, object_names in share_data.objects_removed_from_collection.items():
         for object_name in object_names:
-            collection_api.send_remove_object_from_collection(share_data.client, collection_name, object_name)
-            changed = True
-    return changed
+            collection_api.send_remove_object_from_collection(
+                share_data.client, collection_name, object_name, out=commands
+            )
+    collection_api.send_commands(share_data.client, commands)
+    return bool(commands)
 
 
 def remove_collections_from_scenes():
@@ -470,11 +473,11 @@ def remove_collections_from_collections():
     """
     Non master collections, actually
     """
-    changed = False
+    commands: List[Command] = []
     for parent_name, child_name in share_data.collections_removed_from_collection:
-        collection_api.send_remove_collection_from_collection(share_data.client, parent_name, child_name)
-        changed = True
-    return changed
+        collection_api.send_remove_collection_from_collection(share_data.client, parent_name, child_name, out=commands)
+    collection_api.send_commands(share_data.client, commands)
+    return bool(commands)
 
 
 def add_scenes():
@@ -486,11 +489,11 @@ def add_scenes():
 
 
 def remove_collections():
-    changed = False
+    commands: List[Command] = []
     for collection in share_data.collections_removed:
-        collection_api.send_collection_removed(share_data.client, collection)
-        changed = True
-    return changed
+        collection_api.send_collection_removed(share_data.client, collection, out=commands)
+    collection_api.send_commands(share_data.client, commands)
+    return bool(commands)
 
 
 def add_objects():
@@ -514,19 +517,19 @@ def update_transforms():
 
 
 def add_collections():
-    changed = False
+    commands: List[Command] = []
     for item in share_data.collections_added:
-        collection_api.send_collection(share_data.client, get_collection(item))
-        changed = True
-    return changed
+        collection_api.send_collection(share_data.client, get_collection(item), out=commands)
+    collection_api.send_commands(share_data.client, commands)
+    return bool(commands)
 
 
 def add_collections_to_collections():
-    changed = False
+    commands: List[Command] = []
     for parent_name, child_name in share_data.collections_added_to_collection:
-        collection_api.send_add_collection_to_collection(share_data.client, parent_name, child_name)
-        changed = True
-    return changed
+        collection_api.send_add_collection_to_collection(share_data.client, parent_name, child_name, out=commands)
+    collection_api.send_commands(share_data.client, commands)
+    return bool(commands)
 
 
 def add_collections_to_scenes():
@@ -538,12 +541,12 @@ def add_collections_to_scenes():
 
 
 def add_objects_to_collections():
-    changed = False
+    commands: List[Command] = []
     for collection_name, object_names in share_data.objects_added_to_collection.items():
         for object_name in object_names:
-            collection_api.send_add_object_to_collection(share_data.client, collection_name, object_name)
-            changed = True
-    return changed
+            collection_api.send_add_object_to_collection(share_data.client, collection_name, object_name, out=commands)
+    collection_api.send_commands(share_data.client, commands)
+    return bool(commands)
 
 
 def add_objects_to_scenes():
@@ -556,7 +559,7 @@ def add_objects_to_scenes():
 
 
 def update_collections_parameters():
-    changed = False
+    commands: List[Command] = []
     for collection in share_data.blender_collections.values():
         info = share_data.collections_info.get(collection.name_full)
         if info:
@@ -569,9 +572,9 @@ def update_collections_parameters():
                 or info.hide_viewport != collection.hide_viewport
                 or info.instance_offset != collection.instance_offset
             ):
-                collection_api.send_collection(share_data.client, collection)
-                changed = True
-    return changed
+                collection_api.send_collection(share_data.client, collection, out=commands)
+    collection_api.send_commands(share_data.client, commands)
+    return bool(commands)
 
 
 def delete_scene_objects():
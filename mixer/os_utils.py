@@ -19,6 +19,7 @@
 Utility functions that may require os/platform specific adjustments
 """
 
+import functools
 import getpass
 import os
 import platform
@@ -33,6 +34,7 @@ import bpy
 import addon_utils
 
 
+@functools.lru_cache(maxsize=None)
 def getuser() -> str:
     try:
         return getpass.getuser()
@@ -53,6 +53,7 @@ from mixer.connection import join_room
 from mixer.broadcaster.common import RoomAttributes
 from mixer.share_data import share_data
 from mixer.blender_client.client import clear_scene_content
+import select
 import sys
 import time
 
@@ -68,7 +69,13 @@ def wait_joinable():
     share_data.client.send_list_rooms()
     joinable = False
     while not joinable and time.monotonic() - start < max_wait:
-        time.sleep(0.1)
+        # wake up as soon as the server answers rather than on a fixed period
+        sock = share_data.client.socket
+        if sock is not None:
+            select.select([sock], [], [], 0.1)
+        else:
+            # connection lost, keep the previous behavior and time out
+            time.sleep(0.1)
         share_data.client.fetch_incoming_commands()
         room_attributes = share_data.client.rooms_attributes.get("{room_name}")
         if room_attributes is not None:
@@ -79,34 +86,44 @@ def wait_joinable():
 if wait_joinable():
     join_room("{room_name}", {vrtist_protocol}, {shared_folders}, True)
 else:
-    print(f"ERROR: Cannot join room after {max_wait} seconds. Abort")
-    time.sleep(5)
+    print("ERROR: Cannot join room after", max_wait, "seconds. Abort", flush=True)
     sys.exit(1)
 """
 
 
 class BlenderApp:
-    def __init__(self, port: int, ptvsd_port: int = None, wait_for_debugger=False):
-        self._port = port
+    def __init__(self, port: Optional[int] = None, ptvsd_port: int = None, wait_for_debugger=False):
+        """
+        Args:
+            port: the port the Blender python server listens to. A free port is selected if None
+        """
         self._ptvsd_port = ptvsd_port
         self._wait_for_debugger = wait_for_debugger
-        self._blender: BlenderServer = BlenderServer(self._port, self._ptvsd_port, self._wait_for_debugger)
+        self._blender: BlenderServer = BlenderServer(port, self._ptvsd_port, self._wait_for_debugger)
         self._log_level = logging.WARNING
 
     def set_log_level(self, log_level: int):
         self._log_level = log_level
 
     def setup(self, blender_args: List = None, env: Optional[Mapping[str, str]] = None):
+        self.start(blender_args, env)
+        self.connect()
+
+    def start(self, blender_args: List = None, env: Optional[Mapping[str, str]] = None):
+        """Start the Blender process, without waiting for its python server"""
         self._blender.start(blender_args, env)
+
+    def connect(self):
+        """Connect to the python server of a started Blender"""
         self._blender.connect()
 
     def connect_mixer(self):
         """Emit a mixer connect command"""
+        scripts = []
         if self._log_level is not None:
-            set_log_level = _set_log_level.format(log_level=self._log_level)
-            self._blender.send_string(set_log_level)
-
-        self._blender.send_string(_connect)
+            scripts.append(_set_log_level.format(log_level=self._log_level))
+        scripts.append(_connect)
+        self._blender.send_strings(scripts)
 
     def create_room(
         self,
@@ -123,10 +140,8 @@ class BlenderApp:
             shared_folders=list(shared_folders),
             ignore_version_check=ignore_version_check,
         )
-        self._blender.send_string(create_room)
-
         keep_room_open = _keep_room_open.format(room_name=room_name, keep_room_open=keep_room_open)
-        self._blender.send_string(keep_room_open)
+        self._blender.send_strings((create_room, keep_room_open))
 
     def join_room(
         self,
@@ -141,7 +156,6 @@ class BlenderApp:
             vrtist_protocol=vrtist_protocol,
             shared_folders=list(shared_folders),
             ignore_version_check=ignore_version_check,
-            max_wait="{max_wait}",
         )
         self._blender.send_string(join_room)
 
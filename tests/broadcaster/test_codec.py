@@ -0,0 +1,69 @@
+from types import SimpleNamespace
+import unittest
+
+import mixer.broadcaster.common as common
+
+
+class TestCodec(unittest.TestCase):
+    def setUp(self):
+        self.prefix = b"\x01\x02\x03"
+        self.strings = ["", "ascii", "Collection.001", "éàü", "日本語", "emoji 🙂"]
+
+    def test_string(self):
+        for value in self.strings:
+            with self.subTest(value=value):
+                encoded = common.encode_string(value)
+                self.assertEqual(len(encoded), 4 + len(value.encode()))
+
+                decoded, end = common.decode_string(encoded, 0)
+                self.assertEqual(decoded, value)
+                self.assertEqual(end, len(encoded))
+
+                buffer = self.prefix + encoded + b"trailing"
+                decoded, end = common.decode_string(buffer, len(self.prefix))
+                self.assertEqual(decoded, value)
+                self.assertEqual(end, len(self.prefix) + len(encoded))
+
+    def test_string_pair(self):
+        for first in self.strings:
+            for second in reversed(self.strings):
+                with self.subTest(first=first, second=second):
+                    encoded = common.encode_string(first) + common.encode_string(second)
+
+                    decoded_first, decoded_second, end = common.decode_string_pair(encoded)
+                    self.assertEqual((decoded_first, decoded_second), (first, second))
+                    self.assertEqual(end, len(encoded))
+
+                    buffer = self.prefix + encoded + b"trailing"
+                    decoded_first, decoded_second, end = common.decode_string_pair(buffer, len(self.prefix))
+                    self.assertEqual((decoded_first, decoded_second), (first, second))
+                    self.assertEqual(end, len(self.prefix) + len(encoded))
+
+    def test_string_pair_matches_decode_string(self):
+        buffer = self.prefix + common.encode_string("parent é") + common.encode_string("child 日本")
+        first, index = common.decode_string(buffer, len(self.prefix))
+        second, index = common.decode_string(buffer, index)
+        self.assertEqual(common.decode_string_pair(buffer, len(self.prefix)), (first, second, index))
+
+    def test_bool(self):
+        for value in (True, False):
+            with self.subTest(value=value):
+                buffer = self.prefix + common.encode_bool(value)
+                decoded, end = common.decode_bool(buffer, len(self.prefix))
+                self.assertIs(decoded, value)
+                self.assertEqual(end, len(buffer))
+
+    def test_vector3(self):
+        # values exactly representable as float32
+        vector = SimpleNamespace(x=0.5, y=-2.0, z=3.25)
+        encoded = common.encode_vector3(vector)
+        self.assertEqual(len(encoded), 3 * 4)
+
+        buffer = self.prefix + encoded + b"trailing"
+        decoded, end = common.decode_vector3(buffer, len(self.prefix))
+        self.assertEqual(tuple(decoded), (0.5, -2.0, 3.25))
+        self.assertEqual(end, len(self.prefix) + len(encoded))
+
+
+if __name__ == "__main__":
+    unittest.main()
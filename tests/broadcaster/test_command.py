@@ -0,0 +1,94 @@
+import socket
+import unittest
+from unittest.mock import patch
+
+import mixer.broadcaster.client
+from mixer.broadcaster.client import Client
+import mixer.broadcaster.common as common
+from mixer.broadcaster.socket import Socket
+
+
+class TestCommandWrite(unittest.TestCase):
+    def setUp(self):
+        self.payloads = [b"", b"small payload", bytes(range(256)) * 4096]
+
+    def test_write_to_matches_to_byte_buffer(self):
+        for payload in self.payloads:
+            with self.subTest(size=len(payload)):
+                command = common.Command(common.MessageType.COMMAND, payload)
+                buffer = bytearray()
+                command.write_to(buffer)
+                self.assertEqual(bytes(buffer), command.to_byte_buffer())
+                self.assertEqual(len(buffer), command.byte_size())
+
+    def test_write_to_appends(self):
+        commands = [common.Command(common.MessageType.COMMAND, payload) for payload in self.payloads]
+        buffer = bytearray()
+        for command in commands:
+            command.write_to(buffer)
+        expected = b"".join(command.to_byte_buffer() for command in commands)
+        self.assertEqual(bytes(buffer), expected)
+
+
+class TestBatchedFlush(unittest.TestCase):
+    def setUp(self):
+        sender, receiver = socket.socketpair()
+        self.sender = Socket(sender)
+        self.receiver = Socket(receiver)
+
+    def tearDown(self):
+        self.sender.close()
+        self.receiver.close()
+
+    def test_fetch_outgoing_commands_round_trip(self):
+        # keep the payloads small enough not to fill the socket buffers, since sender and receiver share a thread
+        payloads = [b"", b"first", b"second", bytes(range(256)) * 16]
+        commands = [common.Command(common.MessageType.COMMAND, payload) for payload in payloads]
+
+        client = Client()
+        client.socket = self.sender
+        try:
+            client.add_commands(commands)
+            client.fetch_outgoing_commands()
+            self.assertEqual(client.pending_commands, [])
+        finally:
+            # do not let Client.__del__() disconnect the socket pair
+            client.socket = None
+
+        received = common.read_all_messages(self.receiver)
+        self.assertEqual(len(received), len(commands))
+        for sent, read in zip(commands, received):
+            self.assertEqual(read.type, sent.type)
+            self.assertEqual(read.id, sent.id)
+            self.assertEqual(read.data, sent.data)
+
+    def test_fetch_outgoing_commands_flush_size(self):
+        payloads = [b"", b"first", bytes(range(256)), b"second", bytes(range(256)) * 2, b"last"]
+        commands = [common.Command(common.MessageType.COMMAND, payload) for payload in payloads]
+
+        client = Client()
+        client.socket = self.sender
+        try:
+            client.add_commands(commands)
+            with patch.object(mixer.broadcaster.client, "_flush_size", 256), patch.object(
+                common, "write_buffer", wraps=common.write_buffer
+            ) as write_buffer:
+                client.fetch_outgoing_commands()
+            self.assertEqual(client.pending_commands, [])
+        finally:
+            # do not let Client.__del__() disconnect the socket pair
+            client.socket = None
+
+        # flushed after each large payload, then once more for the last one
+        self.assertEqual(write_buffer.call_count, 3)
+
+        received = common.read_all_messages(self.receiver)
+        self.assertEqual(len(received), len(commands))
+        for sent, read in zip(commands, received):
+            self.assertEqual(read.type, sent.type)
+            self.assertEqual(read.id, sent.id)
+            self.assertEqual(read.data, sent.data)
+
+
+if __name__ == "__main__":
+    unittest.main()
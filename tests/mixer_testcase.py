@@ -93,29 +93,33 @@ class MixerTestCase(unittest.TestCase):
         Not recommended) as it is machine dependent
         """
         super().setUp()
+        blenders: List[BlenderApp] = []
         try:
-            python_port = 8081
             # do not the the default ptvsd port as it will be in use when debugging the TestCase
             ptvsd_port = 5688
 
             # start a broadcaster server
             self._server_process.start(server_args=server_args)
 
-            # start all the blenders
+            # start all the blenders, so that their startups overlap
             window_width = int(1920 / len(blenderdescs))
 
             for i, blenderdesc in enumerate(blenderdescs):
-                shared_folders = self.shared_folders[i] if i < len(self.shared_folders) else []
-                if not isinstance(shared_folders, (list, tuple)):
-                    self.fail(f"shared_folder must be a list or tuple, not a {type(shared_folders)}")
-
                 window_x = str(i * window_width)
                 args = ["--window-geometry", window_x, "0", "960", "1080"]
                 if blenderdesc.load_file is not None:
                     args.append(str(blenderdesc.load_file))
-                blender = BlenderApp(python_port + i, ptvsd_port + i, blenderdesc.wait_for_debugger)
+                blender = BlenderApp(None, ptvsd_port + i, blenderdesc.wait_for_debugger)
                 blender.set_log_level(self._log_level)
-                blender.setup(args)
+                blender.start(args)
+                blenders.append(blender)
+
+            for i, blender in enumerate(blenders):
+                shared_folders = self.shared_folders[i] if i < len(self.shared_folders) else []
+                if not isinstance(shared_folders, (list, tuple)):
+                    self.fail(f"shared_folder must be a list or tuple, not a {type(shared_folders)}")
+
+                blender.connect()
                 if join:
                     blender.connect_mixer()
                     if i == 0:
@@ -131,6 +135,10 @@ class MixerTestCase(unittest.TestCase):
 
             mixer.codec.register()
         except Exception:
+            # the blenders that were started but not connected are not known to shutdown()
+            for blender in blenders:
+                if blender not in self._blenders:
+                    blender.kill()
             self.shutdown()
             raise
 
@@ -139,14 +147,21 @@ class MixerTestCase(unittest.TestCase):
         super().tearDown()
 
     def shutdown(self):
-        # quit and wait
+        # quit all, then wait, so that the blenders shut down concurrently
+        quitting = []
         for blender in self._blenders:
             try:
                 blender.quit()
+                quitting.append(blender)
+            except Exception:
+                # always close server
+                pass
+
+        for blender in quitting:
+            try:
                 blender.wait()
                 blender.close()
             except Exception:
-                # always close server
                 pass
 
         self._server_process.kill()
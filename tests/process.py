@@ -2,6 +2,7 @@ import inspect
 import logging
 import os
 from pathlib import Path
+import select
 import socket
 import subprocess
 import sys
@@ -53,6 +54,13 @@ else:
     _popen_redirect = {}
 
 
+def free_port() -> int:
+    """Returns a TCP port that is currently not in use on the loopback interface"""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
 def blender_exe_path() -> str:
     blender_exe = os.environ.get("MIXER_BLENDER_EXE_PATH")
     if blender_exe is None:
@@ -87,6 +95,19 @@ class Process:
             raise
 
     def wait(self, timeout: float = None):
+        if timeout is not None and self._process.returncode is None and hasattr(os, "pidfd_open"):
+            # Popen.wait() polls when given a timeout. Block until the process exits or the timeout expires instead
+            try:
+                pidfd = os.pidfd_open(self._process.pid)
+            except OSError:
+                pass
+            else:
+                try:
+                    select.select([pidfd], [], [], timeout)
+                finally:
+                    os.close(pidfd)
+                timeout = 0
+
         try:
             return self._process.wait(timeout)
         except subprocess.TimeoutExpired:
@@ -141,9 +162,10 @@ class BlenderServer(BlenderProcess):
     by sending python source code.
     """
 
-    def __init__(self, port: int, ptvsd_port: int = None, wait_for_debugger=False):
+    def __init__(self, port: Optional[int] = None, ptvsd_port: int = None, wait_for_debugger=False):
         super().__init__()
-        self._port = port
+        # let concurrent BlenderServer instances run without port collisions
+        self._port = port if port is not None else free_port()
         self._ptvsd_port = ptvsd_port
         self._wait_for_debugger = wait_for_debugger
         self._path = str(current_dir / "python_server.py")
@@ -203,9 +225,12 @@ class BlenderServer(BlenderProcess):
         # otherwise they get buffered here on startup and Blender gets all the scripts at once before
         # the initial synchronization is done
         buffer = script.encode("utf-8")
-        length_buffer = encode_int(len(buffer))
-        self._sock.send(length_buffer)
-        self._sock.send(buffer)
+        # a single write for the length and the script, that also retries partial writes
+        self._sock.sendall(encode_int(len(buffer)) + buffer)
+
+    def send_strings(self, scripts: Iterable[str]):
+        """Send several scripts in a single message, to be executed in sequence by a single exec()"""
+        self.send_string("\n".join(scripts))
 
     def send_function(self, f: Callable, *args, **kwargs):
         """
@@ -1,8 +1,10 @@
 import argparse
 import asyncio
+import functools
 import logging
 import struct
 import sys
+from types import CodeType
 
 import bpy
 
@@ -30,6 +32,12 @@ STRING_MAX = 1024 * 1024
 INT_SIZE = struct.calcsize("i")
 
 
+@functools.lru_cache(maxsize=64)
+def compile_script(source: str) -> CodeType:
+    """The tests send the same scripts many times, compile them only once"""
+    return compile(source, "<string>", "exec")
+
+
 async def exec_buffer(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
     while True:
         buffer = await reader.read(INT_SIZE)
@@ -42,7 +50,7 @@ async def exec_buffer(reader: asyncio.StreamReader, writer: asyncio.StreamWriter
         logger.debug(buffer.decode("utf-8"))
         buffer_string = buffer.decode("utf-8")
         try:
-            code = compile(buffer_string, "<string>", "exec")
+            code = compile_script(buffer_string)
             share_data.pending_test_update = True
             exec(code, {})
         except Exception: